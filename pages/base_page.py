@@ -1,45 +1,229 @@
+import functools
 import logging
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+import os
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from selenium.common.exceptions import (NoSuchElementException, TimeoutException, WebDriverException,
+                                        StaleElementReferenceException, ElementNotInteractableException,
+                                        MoveTargetOutOfBoundsException)
 from selenium.webdriver.remote.webelement import WebElement
-from utils.logging_config import setup_logger
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as ec
-setup_logger()
+
+logger = logging.getLogger(__name__)
+_WAIT_IGNORED_EXCEPTIONS = (StaleElementReferenceException, ElementNotInteractableException,
+                            MoveTargetOutOfBoundsException)
+_DEFAULT_POLL_MS = 100
+# Drivers whose implicit wait was disabled by a page, so the next pages on the same driver don't send it again.
+_drivers_without_implicit_wait = weakref.WeakSet()
+_FIND_ALL_STRATEGIES = frozenset({By.ID, By.NAME, By.CLASS_NAME, By.TAG_NAME, By.CSS_SELECTOR, By.XPATH})
+_FIND_ALL_SCRIPT = '''
+const [locators, allMatches, returnText, attribute] = arguments;
+const findAll = (by, value) => {
+    switch (by) {
+        case 'id': return [document.getElementById(value)].filter(Boolean);
+        case 'name': return Array.from(document.getElementsByName(value));
+        case 'class name': return Array.from(document.getElementsByClassName(value));
+        case 'tag name': return Array.from(document.getElementsByTagName(value));
+        case 'xpath': {
+            const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: result.snapshotLength}, (_, index) => result.snapshotItem(index));
+        }
+        default: return Array.from(document.querySelectorAll(value));
+    }
+};
+const findFirst = (by, value) => {
+    switch (by) {
+        case 'xpath':
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'css selector': return document.querySelector(value);
+        default: return findAll(by, value)[0] || null;
+    }
+};
+const read = element => {
+    if (returnText) {
+        return element.innerText;
+    }
+    return attribute === null ? element : element.getAttribute(attribute);
+};
+return locators.map(([by, value]) => {
+    if (allMatches) {
+        return findAll(by, value).map(read);
+    }
+    const element = findFirst(by, value);
+    return element === null ? null : read(element);
+});
+'''
+
+
+def _read_poll_frequency() -> float:
+    """
+    Read the default poll frequency from the UTAF_POLL_MS environment variable, in milliseconds.
+
+    :return: The poll frequency in seconds, 0.1 seconds when the variable isn't set or isn't a positive number.
+    """
+    poll_ms = os.environ.get('UTAF_POLL_MS')
+    if poll_ms is None:
+        return _DEFAULT_POLL_MS / 1000
+    try:
+        poll_frequency = float(poll_ms) / 1000
+    except ValueError:
+        poll_frequency = 0
+    if poll_frequency > 0:
+        return poll_frequency
+    logger.warning('Invalid UTAF_POLL_MS value: %r, using %s ms instead.', poll_ms, _DEFAULT_POLL_MS)
+    return _DEFAULT_POLL_MS / 1000
+
+
+DEFAULT_POLL_FREQUENCY = _read_poll_frequency()
+
+
+@functools.lru_cache(maxsize=256)
+def _presence_of_element_located(locator: tuple):
+    """
+    Get the cached presence_of_element_located condition for a locator.
+
+    :param locator: Tuple containing (By.<method>, locator string), e.g., (By.ID, "element_id").
+    :return: The expected condition callable.
+    """
+    return ec.presence_of_element_located(locator)
+
+
+@functools.lru_cache(maxsize=256)
+def _presence_of_all_elements_located(locator: tuple):
+    """
+    Get the cached presence_of_all_elements_located condition for a locator.
+
+    :param locator: Tuple containing (By.<method>, locator string), e.g., (By.ID, "element_id").
+    :return: The expected condition callable.
+    """
+    return ec.presence_of_all_elements_located(locator)
 
 
 class BasePage:
 
-    def __init__(self, driver, timeout: int = 10):
+    __slots__ = ('driver', 'timeout', 'poll_frequency', 'logger', '_element_cache', '_visible_conditions', '_wait',
+                 '_implicit_wait')
+
+    element_cache_size = 128
+
+    def __init__(self, driver, timeout: int = 10, poll_frequency: float = DEFAULT_POLL_FREQUENCY):
         """
         Initializes the BasePage class.
 
         :param driver: Appium/Selenium WebDriver instance.
         :param timeout: Timeout duration for waiting for elements (default is 10 seconds).
+        :param poll_frequency: Interval in seconds between condition checks while waiting (default is 0.1 seconds,
+                               or the UTAF_POLL_MS environment variable in milliseconds if it is set).
+                               Lower values find elements sooner but send more requests to the WebDriver endpoint,
+                               e.g., 0.05 suits local drivers and 0.2 suits cloud grids.
+
+        The implicit wait of the driver is disabled by the first page created on it, whichever way the driver was
+        created, so it doesn't add up with the explicit waits of the page. The next pages on the same driver don't send
+        it again. Use with_implicit_wait() where an implicit wait is really needed.
         """
         self.driver = driver
         self.timeout = timeout
-        self.logger = logging.getLogger(__name__)
+        self.poll_frequency = poll_frequency
+        self.logger = logger
+        self._element_cache: OrderedDict[tuple, WebElement] = OrderedDict()
+        self._visible_conditions: dict[tuple, Callable[[object], WebElement | bool]] = {}
+        self._wait = self._create_wait()
+        if driver not in _drivers_without_implicit_wait:
+            self.driver.implicitly_wait(0)
+            _drivers_without_implicit_wait.add(driver)
+        self._implicit_wait = 0
 
-    def find_element(self, locator: tuple) -> WebElement:
+    def find_element(self, locator: tuple, visible: bool = True, check_cached: bool = True) -> WebElement:
         """
-        Find a single element with visibility condition.
+        Find a single element with visibility condition, or with presence condition when visible is False.
+
+        Elements found previously with the same locator are reused as long as they are still attached to the DOM and
+        visible, otherwise they are located again. Pass visible=False when a reference to the element is enough, which
+        saves the visibility check on every poll (see find_present_element).
+
+        Pass check_cached=False to return a cached element without any request to the WebDriver endpoint, e.g., for an
+        element that is acted on right away. It may have gone stale or hidden since, so call evict_element and find it
+        again when the action raises StaleElementReferenceException.
 
         :param locator: Tuple containing (By.<method>, locator string), e.g., (By.ID, "element_id").
+        :param visible: Whether to wait for the element to be visible instead of present (default is True).
+        :param check_cached: Whether to check that a cached element is still attached and visible before returning it
+                             (default is True).
         :return: The mobile element is found.
         :raises TimeoutException: If the element isn't found within the timeout.
         :raises WebDriverException: If there are issues with WebDriver.
         """
+        if not visible:
+            return self.find_present_element(locator)
+        if not check_cached:
+            key = (locator, 'visible')
+            element = self._element_cache.get(key)
+            if element is not None:
+                self.logger.debug('Reusing cached element with locator: %s without checking it.', locator)
+                self._element_cache.move_to_end(key)
+                return element
+        try:
+            self.logger.info('Finding element with locator: %s with waiting %s sec '
+                             'to be visible.', locator, self.timeout)
+            with self._no_implicit_wait():
+                return self._wait.until(self._visible_element(locator))
+        except TimeoutException as e:
+            self.logger.error('Element not found or not visible! Locator: %s, Error: %s', locator, e)
+            raise
+        except WebDriverException as e:
+            self.logger.error('An error occurred while trying to find an element! Locator:%s. Error: %s', locator, e)
+            raise
+
+    def find_visible(self, locator: tuple, timeout: float | None = None) -> WebElement | None:
+        """
+        Find a single visible element, or None if it isn't visible within the timeout.
+
+        Unlike find_element, no exception is raised on timeout, so the caller decides how to handle a missing element.
+        Elements found previously with the same locator are reused as long as they are still attached to the DOM and
+        visible.
+
+        :param locator: Tuple containing (By.<method>, locator string), e.g., (By.ID, "element_id").
+        :param timeout: Timeout duration in seconds, the timeout of the page when None (default is None).
+        :return: The element found, or None if it isn't visible within the timeout.
+        :raises WebDriverException: If there are issues with WebDriver.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        wait = self._wait if timeout == self.timeout else self._create_wait(timeout)
+        self.logger.info('Finding element with locator: %s with waiting %s sec to be visible.', locator, timeout)
+        try:
+            with self._no_implicit_wait():
+                return wait.until(self._visible_element(locator))
+        except TimeoutException:
+            return None
+
+    def find_present_element(self, locator: tuple) -> WebElement:
+        """
+        Find a single element with presence condition.
+
+        Unlike find_element, the visibility of the element isn't checked on every poll, which saves one request to the
+        WebDriver endpoint per poll when the caller only needs the element to exist.
+
+        :param locator: Tuple containing (By.<method>, locator string), e.g., (By.ID, "element_id").
+        :return: The element is found.
+        :raises TimeoutException: If the element isn't present within the timeout.
+        :raises WebDriverException: If there are issues with WebDriver.
+        """
         try:
-            self.logger.info(f'Finding element with locator: {locator} with waiting {self.timeout} sec te be visible.')
-            element = WebDriverWait(self.driver, self.timeout).until(
-                ec.visibility_of_element_located(locator)
-            )
+            self.logger.info('Finding element with locator: %s with waiting %s sec '
+                             'to be present.', locator, self.timeout)
+            with self._no_implicit_wait():
+                element = self._wait.until(_presence_of_element_located(locator))
             return element
         except TimeoutException as e:
-            self.logger.error(f'Element not found or not visible! Locator: {locator}, Error: {str(e)}')
+            self.logger.error('Element not found or not present! Locator: %s, Error: %s', locator, e)
             raise
         except WebDriverException as e:
-            self.logger.error(f'An error occurred while trying to find an element! Locator:{locator}. Error: {str(e)}')
+            self.logger.error('An error occurred while trying to find an element! Locator:%s. Error: %s', locator, e)
             raise
 
     def find_elements(self, locator: tuple) -> list[WebElement]:
@@ -52,14 +236,248 @@ class BasePage:
         :raises WebDriverException: If there are issues with WebDriver.
         """
         try:
-            self.logger.info(f'Finding elements with locator {locator} with waiting {self.timeout} sec te be presence.')
-            elements = WebDriverWait(self.driver, self.timeout).until(
-                ec.presence_of_all_elements_located(locator)
-            )
+            self.logger.info('Finding elements with locator %s with waiting %s sec '
+                             'to be presence.', locator, self.timeout)
+            with self._no_implicit_wait():
+                elements = self._wait.until(_presence_of_all_elements_located(locator))
             return elements
         except TimeoutException as e:
-            self.logger.error(f'Elements not found or not presence! Locator: {locator}, Error: {str(e)}')
+            self.logger.error('Elements not found or not presence! Locator: %s, Error: %s', locator, e)
             raise
         except WebDriverException as e:
-            self.logger.error(f'An error occurred while trying to find elements! Locator:{locator}. Error: {str(e)}')
+            self.logger.error('An error occurred while trying to find elements! Locator:%s. Error: %s', locator, e)
             raise
+
+    def find_elements_batch(self, css_selectors: list[str]) -> list[list[WebElement]]:
+        """
+        Find all elements matching each of the CSS selectors with a single WebDriver call using JavaScript.
+
+        Shortcut of find_all(locators, all_matches=True) for CSS selectors (By.CSS_SELECTOR).
+
+        :param css_selectors: List of CSS selectors, e.g., ["#username", "table tr"].
+        :return: List containing the elements found for each selector, in the same order as the selectors.
+        :raises WebDriverException: If there are issues with WebDriver.
+        """
+        return self.find_all([(By.CSS_SELECTOR, css_selector) for css_selector in css_selectors], all_matches=True)
+
+    def find_all(self, locators: list[tuple],
+                 all_matches: bool = False) -> list[WebElement | None] | list[list[WebElement]]:
+        """
+        Find the first element, or all elements with all_matches=True, matching each of the locators with a single
+        WebDriver call using JavaScript.
+
+        Supported strategies are By.ID, By.NAME, By.CLASS_NAME, By.TAG_NAME, By.CSS_SELECTOR, and By.XPATH. Nothing is
+        waited for, so call it once the page is loaded. When JavaScript can't be executed, e.g., in a native mobile
+        context, the locators are looked up one by one instead.
+
+        :param locators: List of tuples containing (By.<method>, locator string), e.g., [(By.ID, "username")].
+        :param all_matches: Whether to return all elements matching each locator instead of the first one
+                            (default is False).
+        :return: List containing the element found for each locator, or None if none matches, in the same order as
+                 the locators. With all_matches=True, list containing the list of elements found for each locator.
+        :raises ValueError: If a locator strategy isn't supported.
+        :raises WebDriverException: If there are issues with WebDriver.
+        """
+        return self._find_all(locators, all_matches, False, None)
+
+    @staticmethod
+    def bulk(calls: list[Callable[[], object]], max_workers: int = 8) -> list:
+        """
+        Run independent page operations concurrently, e.g., opening URLs on pages that each have their own driver.
+
+        The WebDriver calls are waiting on I/O, so running them in threads speeds them up almost linearly. A driver
+        isn't thread-safe, so every call must use a different driver,
+        e.g., BasePage.bulk([lambda p=page, u=url: p.open_url(u) for page, url in zip(pages, urls)]).
+
+        :param calls: List of callables without arguments, each using its own driver.
+        :param max_workers: Maximum number of threads running the calls (default is 8).
+        :return: List of the results of the calls, in the same order as the calls.
+        :raises Exception: The first exception raised by a call, in the order of the calls.
+        """
+        logger.info('Running %s page operations with up to %s threads.', len(calls), max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    def set_timeout(self, timeout: int) -> None:
+        """
+        Change the timeout duration for waiting for elements.
+
+        :param timeout: Timeout duration in seconds.
+        :return: None.
+        """
+        self.logger.info('Setting the timeout to %s sec.', timeout)
+        self.timeout = timeout
+        self._wait = self._create_wait()
+
+    def _create_wait(self, timeout: float | None = None) -> WebDriverWait:
+        """
+        Create the wait shared by the methods of the page, or a wait with another timeout.
+
+        Transient errors of elements that are being re-rendered, moved, or made interactable are ignored while polling,
+        so the condition is simply checked again on the next poll instead of failing. The trade-off is that these
+        errors surface only as a TimeoutException when they persist until the timeout.
+
+        :param timeout: Timeout duration in seconds, the timeout of the page when None (default is None).
+        :return: WebDriverWait instance with the timeout and the poll frequency of the page.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        return WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency,
+                             ignored_exceptions=_WAIT_IGNORED_EXCEPTIONS)
+
+    @contextmanager
+    def with_implicit_wait(self, seconds: float):
+        """
+        Temporarily enable the implicit wait of the driver.
+
+        :param seconds: Implicit wait duration in seconds to use inside the context.
+        :return: A context manager that restores the previous implicit wait on exit.
+        :raises WebDriverException: If WebDriver encountered an error during setting the implicit wait.
+        """
+        previous_implicit_wait = self._implicit_wait
+        self.logger.info('Setting the implicit wait to %s sec.', seconds)
+        self.driver.implicitly_wait(seconds)
+        self._implicit_wait = seconds
+        try:
+            yield
+        finally:
+            self.logger.info('Restoring the implicit wait to %s sec.', previous_implicit_wait)
+            self.driver.implicitly_wait(previous_implicit_wait)
+            self._implicit_wait = previous_implicit_wait
+
+    @contextmanager
+    def _no_implicit_wait(self):
+        """
+        Temporarily disable the implicit wait of the driver, so it doesn't add up with the explicit wait of the page.
+
+        Nothing is sent to the driver when the implicit wait is already disabled, which is the default.
+
+        :return: A context manager that restores the implicit wait on exit.
+        :raises WebDriverException: If WebDriver encountered an error during setting the implicit wait.
+        """
+        implicit_wait = self._implicit_wait
+        if not implicit_wait:
+            yield
+            return
+        self.driver.implicitly_wait(0)
+        self._implicit_wait = 0
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(implicit_wait)
+            self._implicit_wait = implicit_wait
+
+    def clear_element_cache(self) -> None:
+        """
+        Clear the cached elements, e.g., after navigating to another page.
+
+        :return: None.
+        """
+        self.logger.info('Clearing the element cache.')
+        self._element_cache.clear()
+
+    def evict_element(self, locator: tuple) -> None:
+        """
+        Remove the element cached for a locator, e.g., after it went stale.
+
+        :param locator: Tuple containing (By.<method>, locator string), e.g., (By.ID, "element_id").
+        :return: None.
+        """
+        self._element_cache.pop((locator, 'visible'), None)
+
+    def _find_all(self, locators: list[tuple], all_matches: bool, return_text: bool, attribute: str | None) -> list:
+        """
+        Find the elements matching each of the locators with a single WebDriver call using JavaScript, and return them,
+        their texts, or one of their attributes.
+
+        :param locators: List of tuples containing (By.<method>, locator string), e.g., [(By.ID, "username")].
+        :param all_matches: Whether to return all elements matching each locator instead of the first one.
+        :param return_text: Whether to return the inner text of the elements instead of the elements.
+        :param attribute: Name of the HTML attribute to return instead of the elements, or None.
+        :return: List containing the result for each locator, in the same order as the locators.
+        :raises ValueError: If a locator strategy isn't supported.
+        :raises WebDriverException: If there are issues with WebDriver.
+        """
+        unsupported = [locator for locator in locators if locator[0] not in _FIND_ALL_STRATEGIES]
+        if unsupported:
+            self.logger.error('Locator strategies aren\'t supported to find all elements: %s', unsupported)
+            raise ValueError(f'Unsupported locator strategies: {unsupported}')
+        try:
+            self.logger.info('Finding elements with locators %s using a single script.', locators)
+            return self.driver.execute_script(_FIND_ALL_SCRIPT, [list(locator) for locator in locators], all_matches,
+                                              return_text, attribute)
+        except WebDriverException as e:
+            self.logger.info('Unable to find elements using a single script, finding them one by one. Error: %s', e)
+
+        def read(element):
+            if return_text:
+                return element.text
+            return element if attribute is None else element.get_dom_attribute(attribute)
+        try:
+            if all_matches:
+                return [[read(element) for element in self.driver.find_elements(*locator)] for locator in locators]
+            first_elements = [next(iter(self.driver.find_elements(*locator)), None) for locator in locators]
+            return [None if element is None else read(element) for element in first_elements]
+        except WebDriverException as e:
+            self.logger.error('An error occurred while trying to find elements! Locators: %s. Error: %s', locators, e)
+            raise
+
+    def _visible_element(self, locator: tuple) -> Callable[[object], WebElement | bool]:
+        """
+        Get the wait condition of a visible element, reusing the element cached for the locator while it's usable.
+
+        The condition is created once per locator and page, like the presence conditions, so the lookups of the same
+        locator don't build a new one every time.
+
+        :param locator: Tuple containing (By.<method>, locator string), e.g., (By.ID, "element_id").
+        :return: The condition callable returning the visible element, or False to keep waiting.
+        """
+        condition = self._visible_conditions.get(locator)
+        if condition is not None:
+            return condition
+        key = (locator, 'visible')
+
+        def condition(driver):
+            element = self._get_cached_element(key)
+            if element is not None:
+                self.logger.debug('Reusing cached element with locator: %s.', locator)
+                return element
+            elements = driver.find_elements(*locator)
+            if elements and elements[0].is_displayed():
+                self._cache_element(key, elements[0])
+                return elements[0]
+            return False
+        self._visible_conditions[locator] = condition
+        return condition
+
+    def _get_cached_element(self, key: tuple) -> WebElement | None:
+        """
+        Get a cached element if it is still attached to the DOM and visible.
+
+        :param key: Tuple containing (locator, condition) used to cache the element.
+        :return: The cached element, or None if it isn't cached or no longer usable.
+        """
+        element = self._element_cache.get(key)
+        if element is None:
+            return None
+        try:
+            if element.is_displayed():
+                self._element_cache.move_to_end(key)
+                return element
+        except StaleElementReferenceException:
+            self.logger.debug('Cached element is no longer attached to the DOM. Locator: %s', key[0])
+        del self._element_cache[key]
+        return None
+
+    def _cache_element(self, key: tuple, element: WebElement) -> None:
+        """
+        Cache an element, evicting the least recently used one when the cache is full.
+
+        :param key: Tuple containing (locator, condition) used to cache the element.
+        :param element: The element to cache.
+        :return: None.
+        """
+        self._element_cache[key] = element
+        self._element_cache.move_to_end(key)
+        if len(self._element_cache) > self.element_cache_size:
+            self._element_cache.popitem(last=False)
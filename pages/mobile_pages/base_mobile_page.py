@@ -1,20 +1,64 @@
+import json
+from contextlib import contextmanager
 from appium import webdriver
-from pages.base_page import BasePage
+from pages.base_page import BasePage, DEFAULT_POLL_FREQUENCY
+from utils.logging_config import log_errors
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import (NoSuchElementException, ElementNotInteractableException,
-                                        InvalidElementStateException, StaleElementReferenceException,
-                                        TimeoutException, WebDriverException, MoveTargetOutOfBoundsException)
-from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.actions.pointer_input import PointerInput
 from selenium.webdriver.common.actions import interaction
 from selenium.webdriver.common.actions.action_builder import ActionBuilder
 
+_UNSUPPORTED_TAP_TYPE = 'Unsupported tap type: %s. Supported values are "single" and "double".'
+_INVALID_SWIPE_DIRECTION = 'Invalid swipe direction value: %s. Options are up, down, left, or right.'
+_INVALID_FLICK_DIRECTION = 'Invalid flick direction value: %s. Options are up, or down.'
+_INVALID_PERCENT = 'Invalid percent value: %s. Must be in range 0..1.'
+_TAP_TYPES = frozenset({'single', 'double'})
+_DIRECTIONS = frozenset({'up', 'down', 'left', 'right'})
+_FLICK_DIRECTIONS = frozenset({'up', 'down'})
+_ANDROID_GESTURE_COMMANDS = {
+    'tap': 'mobile: clickGesture',
+    'doubleTap': 'mobile: doubleClickGesture',
+    'longPress': 'mobile: longClickGesture',
+    'drag': 'mobile: dragGesture'
+}
+_IOS_GESTURE_COMMANDS = {
+    'tap': 'mobile: tap',
+    'doubleTap': 'mobile: doubleTap',
+    'longPress': 'mobile: touchAndHold',
+    'drag': 'mobile: dragFromToForDuration'
+}
+_ELEMENT_LOCATIONS_SCRIPT = ('return arguments[0].map(element => {const rect = element.getBoundingClientRect(); '
+                             'return {x: Math.round(rect.left + window.pageXOffset), '
+                             'y: Math.round(rect.top + window.pageYOffset)};});')
+_GESTURE_BATCH_SCRIPT = '''
+const steps = %s;
+const results = [];
+for (const step of steps) {
+    results.push(await driver.execute(step.command, step.args));
+}
+return results;
+'''
+
 
 class BaseMobilePage(BasePage):
 
-    def __init__(self, driver: webdriver.Remote, timeout: int = 10):
-        super().__init__(driver, timeout)
+    __slots__ = ('_execute_script', '_swipe', '_flick', '_touch_actions', '_gesture_commands',
+                 '_batch_locations_supported')
+
+    def __init__(self, driver: webdriver.Remote, timeout: int = 10, poll_frequency: float = DEFAULT_POLL_FREQUENCY):
+        super().__init__(driver, timeout, poll_frequency)
+        self._execute_script = self.driver.execute_script
+        self._swipe = self.driver.swipe
+        self._flick = self.driver.flick
+        self._batch_locations_supported = True
+        self._touch_actions = ActionBuilder(self.driver, mouse=PointerInput(interaction.POINTER_TOUCH, 'touch'))
+        if self.driver.capabilities.get('platformName', '').lower() == 'ios':
+            self._gesture_commands = _IOS_GESTURE_COMMANDS
+        else:
+            self._gesture_commands = _ANDROID_GESTURE_COMMANDS
 
+    @log_errors('Failed to perform a tap gesture using the W3C Actions API')
     def perform_tap_gesture_using_w3c_actions_api(self, element: WebElement, tap_type: str = 'single') -> None:
         """
         Perform a single or double tap gesture using the W3C Actions API.
@@ -36,45 +80,68 @@ class BaseMobilePage(BasePage):
         :raises WebDriverException: If WebDriver encounters an error while performing a single or double tap gesture
                                     using the W3C Actions API.
         """
-        try:
-            self.logger.info('Getting the current location of the element.')
-            element_location = element.location
-            self.logger.info(f'Current location of the element: {element_location}')
-            self.logger.info(f'Performing a {tap_type} tap gesture using the W3C Actions API')
-            if tap_type.lower() == 'single':
-                self.driver.tap([(element_location['x'], element_location['y'])])
-            elif tap_type.lower() == 'double':
-                self.driver.tap([(element_location['x'], element_location['y'])])
-                self.driver.tap([(element_location['x'], element_location['y'])])
-            else:
-                self.logger.error(f'Unsupported tap type: {tap_type}. Supported values are "single" and "double".')
-                raise ValueError(f'Tap type {tap_type} is not supported.')
-            self.logger.info(f'The {tap_type} tap gesture is performed successfully using the W3C Actions API.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform a {tap_type} tap gesture using the W3C Actions API. '
-                              f'Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform a {tap_type} tap gesture using the '
-                              f'W3C Actions API. Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element isn\'t in a valid state to perform a {tap_type} tap gesture using '
-                              f'the W3C Actions API. Error: {e}')
-            raise
-        except StaleElementReferenceException as e:
-            self.logger.error(f'Element is no longer attached to the DOM to perform a {tap_type} tap gesture '
-                              f'using the W3C Actions API. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timeout occurred while performing a {tap_type} tap gesture using the W3C Actions API. '
-                              f'Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing a {tap_type} tap gesture using '
-                              f'the W3C Actions API. Error: {e}.')
-            raise
+        tap = tap_type.lower()
+        if tap not in _TAP_TYPES:
+            self.logger.error(_UNSUPPORTED_TAP_TYPE, tap_type)
+            raise ValueError(_UNSUPPORTED_TAP_TYPE % tap_type)
+        with self._touch_sequence() as pointer_action:
+            pointer_action.move_to(element).pointer_down().pointer_up()
+            if tap == 'double':
+                pointer_action.pause(0.1).pointer_down().pointer_up()
+        self.logger.debug('The %s tap gesture is performed successfully using the W3C Actions API.', tap_type)
+
+    @log_errors('Failed to perform a tap gesture at coordinates using the W3C Actions API')
+    def perform_tap_at(self, x: int, y: int, tap_type: str = 'single') -> None:
+        """
+        Perform a single or double tap gesture at the given screen coordinates using the W3C Actions API.
+
+        Use it instead of perform_tap_gesture_using_w3c_actions_api when the coordinates are already known, e.g., from
+        a previous rect of the element, so no element lookup is needed.
 
+        :param x: The x coordinate to tap.
+        :param y: The y coordinate to tap.
+        :param tap_type: Specifies the type of tap gesture: single or double. By default, it's single tap gesture.
+        :return: None.
+        :raises ValueError: If the provided tap_type is neither 'single' nor 'double'.
+        :raises MoveTargetOutOfBoundsException: If the coordinates are outside the viewport.
+        :raises WebDriverException: If WebDriver encounters an error while performing a single or double tap gesture
+                                    using the W3C Actions API.
+        """
+        tap = tap_type.lower()
+        if tap not in _TAP_TYPES:
+            self.logger.error(_UNSUPPORTED_TAP_TYPE, tap_type)
+            raise ValueError(_UNSUPPORTED_TAP_TYPE % tap_type)
+        with self._touch_sequence() as pointer_action:
+            pointer_action.move_to_location(x, y).pointer_down().pointer_up()
+            if tap == 'double':
+                pointer_action.pause(0.1).pointer_down().pointer_up()
+        self.logger.debug('The %s tap gesture is performed successfully using the W3C Actions API.', tap_type)
+
+    @log_errors('Failed to perform the tap gestures at coordinates using the W3C Actions API')
+    def perform_taps_at(self, points: list[tuple[int, int]], interval: float = 0.1) -> None:
+        """
+        Perform a tap gesture at each of the given screen coordinates, in order, with a single W3C Actions API request.
+
+        :param points: List of (x, y) coordinates to tap, e.g., [(100, 200), (300, 200)].
+        :param interval: Pause in seconds between two taps (default is 0.1 seconds).
+        :return: None.
+        :raises ValueError: If any of the points isn't a pair of coordinates.
+        :raises MoveTargetOutOfBoundsException: If any of the coordinates is outside the viewport.
+        :raises WebDriverException: If WebDriver encounters an error while performing the tap gestures using the W3C
+                                    Actions API.
+        """
+        invalid_points = [point for point in points if not isinstance(point, (tuple, list)) or len(point) != 2]
+        if invalid_points:
+            self.logger.error('Invalid points: %s. Each point must be a pair of (x, y) coordinates.', invalid_points)
+            raise ValueError(f'Invalid points: {invalid_points}. Each point must be a pair of (x, y) coordinates.')
+        with self._touch_sequence() as pointer_action:
+            for index, (x, y) in enumerate(points):
+                if index:
+                    pointer_action.pause(interval)
+                pointer_action.move_to_location(x, y).pointer_down().pointer_up()
+        self.logger.debug('The %s tap gestures are performed successfully using the W3C Actions API.', len(points))
+
+    @log_errors('Failed to perform a tap gesture using the W3C Mobile Gestures Commands')
     def perform_tap_gesture_using_w3c_mobile_gestures_commands(self, element: WebElement,
                                                                tap_type: str = 'single') -> None:
         """
@@ -97,47 +164,18 @@ class BaseMobilePage(BasePage):
         :raises WebDriverException: If WebDriver encounters an error while performing a single or double tap gesture
                                     using the W3C Mobile Gestures Commands.
         """
-        try:
-            self.logger.info('Retrieving the current location of the element.')
-            element_location = element.location
-            self.logger.info(f'Element is located at: {element_location}')
-            if tap_type.lower() not in ['single', 'double']:
-                self.logger.error(f'Unsupported tap type: {tap_type}. Supported values are "single" and "double".')
-                raise ValueError(f'Unsupported tap type: {tap_type}. Supported values are "single" and "double".')
-            self.logger.info(f'Performing a {tap_type} tap gesture using the Mobile Gestures Command.')
-            self.driver.execute_script(
-                f'mobile: {tap_type}', {
-                    'x': element_location['x'],
-                    'y': element_location['y']
-                }
-            )
-            self.logger.info(f'{tap_type.capitalize()} tap gesture successfully performed using the W3C Mobile Gestures'
-                             f' Commands.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform a {tap_type} tap gesture using the W3C Mobile Gestures '
-                              f'Commands. Error: {e}.')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform a {tap_type} tap gesture using the W3C Mobile '
-                              f'Gestures Commands. Error: {e}.')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state to perform a {tap_type} tap gesture using the W3C Mobile'
-                              f' Gestures Commands. Error: {e}.')
-            raise
-        except StaleElementReferenceException as e:
-            self.logger.error(f'Element is no longer attached to the DOM to perform a {tap_type} tap gesture using the '
-                              f'W3C Mobile Gestures Commands. Error: {e}.')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out occurred while performing a {tap_type} tap gesture using the W3C Mobile '
-                              f'Gestures Commands. Error: {e}.')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing a {tap_type} tap gesture using the '
-                              f'W3C Mobile Gestures Commands. Error: {e}.')
-            raise
+        tap = tap_type.lower()
+        if tap not in _TAP_TYPES:
+            self.logger.error(_UNSUPPORTED_TAP_TYPE, tap_type)
+            raise ValueError(_UNSUPPORTED_TAP_TYPE % tap_type)
+        if tap == 'single':
+            self._execute_script(self._gesture_commands['tap'], self._tap_args(element))
+        else:
+            self._execute_script(self._gesture_commands['doubleTap'], {'elementId': element.id})
+        self.logger.debug('The %s tap gesture successfully performed using the W3C '
+                          'Mobile Gestures Commands.', tap_type)
 
+    @log_errors('Failed to perform a drag and drop gesture using the W3C Actions API')
     def perform_drag_and_drop_gesture_using_w3c_actions_api(self, draggable_element: WebElement,
                                                             droppable_element: WebElement) -> None:
         """
@@ -159,37 +197,10 @@ class BaseMobilePage(BasePage):
                                                 gesture using the W3C Actions API.
         :raises WebDriverException: If WebDriver encounters an error while performing a drag and drop gesture.
         """
-        try:
-            self.logger.info("Performing drag and drop action using W3C Actions API.")
-            self.driver.drag_and_drop(draggable_element, droppable_element)
-            self.logger.info("Drag and drop is performed successfully using W3C Actions API.")
-        except NoSuchElementException as e:
-            self.logger.error(f'Draggable or droppable element isn\'t found to perform a drag and drop gesture using '
-                              f'the W3C Actions API. Error: {e}.')
-            raise
-        except StaleElementReferenceException as e:
-            self.logger.error(f'Element is no longer attached to the DOM to perform a drag and drop gesture using '
-                              f'the W3C Actions API. Error {e}.')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform a drag and drop gesture using the '
-                              f'W3C Actions API. Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state to perform a drag and drop gesture using the '
-                              f'W3C Actions API. Error: {e}.')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing drag and drop gesture using the W3C Actions API. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Target element is outside the viewport to perform a drag and drop gesture using '
-                              f'the W3C Actions API. Error: {e}.')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing a drag and drop gesture using '
-                              f'the W3C Actions API. Error: {e}.')
+        self.driver.drag_and_drop(draggable_element, droppable_element)
+        self.logger.debug("Drag and drop is performed successfully using W3C Actions API.")
 
+    @log_errors('Failed to perform a drag and drop gesture using the W3C Mobile Gestures Commands')
     def perform_drag_and_drop_using_w3c_mobile_gestures_commands(self, draggable_element: WebElement,
                                                                  droppable_element: WebElement) -> None:
         """
@@ -213,44 +224,17 @@ class BaseMobilePage(BasePage):
         :raises WebDriverException: If WebDriver encounters an error while performing a drag and drop gesture using W3C
                                     Mobile Gestures Commands.
         """
-        try:
-            self.logger.info("Performing drag and drop gesture using the W3C Mobile Gestures Commands.")
-            self.driver.execute_script(
-                'mobile: dragGesture', {
-                    'elementId': draggable_element,
-                    'endX': droppable_element.location['x'],
-                    'endY': droppable_element.location['y']
-                }
-            )
-            self.logger.info("Drag and drop gesture is performed successfully using the W3C Mobile Gestures Commands.")
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform a drag and drop gesture using the W3C Mobile Gestures '
-                              f'Commands. Error: {e}.')
-            raise
-        except StaleElementReferenceException as e:
-            self.logger.error(f'Element is no longer attached to the DOM to perform a drag and drop gesture using '
-                              f'the W3C Mobile Gestures Commands. Error: {e}.')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform a drag and drop gesture using the W3C Mobile '
-                              f'Gestures Commands. Error: {e}.')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state to perform a drag and drop gesture using the W3C Mobile'
-                              f'Gestures Commands. Error: {e}.')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing a drag and drop gesture using the W3C Mobile Gestures '
-                              f'Commands. Error: {e}.')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Target element is outside the viewport to perform a drag and drop gesture using the '
-                              f'W3C Mobile Gestures Commands. Error: {e}.')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing a drag and drop gesture using the '
-                              f'W3C Mobile Gestures Commands. Error: {e}.')
+        droppable_location = droppable_element.location
+        self._execute_script(
+            'mobile: dragGesture', {
+                'elementId': draggable_element.id,
+                'endX': droppable_location['x'],
+                'endY': droppable_location['y']
+            }
+        )
+        self.logger.debug("Drag and drop gesture is performed successfully using the W3C Mobile Gestures Commands.")
 
+    @log_errors('Failed to perform a long press gesture using the W3C Actions API')
     def perform_long_press_gesture_using_w3c_actions_api(self, element: WebElement) -> None:
         """
         Perform a long press (Press and Hold) gesture using the W3C Actions API.
@@ -269,41 +253,11 @@ class BaseMobilePage(BasePage):
         :raises WebDriverException: If WebDriver encounters an error while performing the long press gesture using
                                     the W3C Actions API.
         """
-        try:
-            self.logger.info('Creating an instance from ActionChains Class.')
-            actions = ActionChains(self.driver)
-            self.logger.info('Creating a touch type of pointer input for gesture.')
-            touch_input = PointerInput(interaction.POINTER_TOUCH, 'touch')
-            self.logger.info('Overriding the pointer action to specify touch input.')
-            actions.w3c_actions = ActionBuilder(self, mouse=touch_input)
-            self.logger.info('Performing long press gesture using the W3C Actions API.')
-            actions.w3c_actions.pointer_action.click_and_hold(element)
-            actions.perform()
-            self.logger.info('The long press gesture was successfully performed using the W3C Actions API.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform a long press gesture using the W3C Actions API. '
-                              f'Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform a long press gesture using the W3C Actions API. '
-                              f'Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state for performing a long press gesture using '
-                              f'the W3C Actions API. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Element is outside the viewport to perform a long press gesture using '
-                              f'the W3C Actions API. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing a long press gesture using the W3C Actions API. Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing a long press gesture using '
-                              f'the W3C Actions API. Error: {e}')
-            raise
+        with self._touch_sequence() as pointer_action:
+            pointer_action.click_and_hold(element)
+        self.logger.debug('The long press gesture was successfully performed using the W3C Actions API.')
 
+    @log_errors('Failed to perform a long press gesture using the W3C Mobile Gestures Commands')
     def perform_long_press_gesture_using_w3c_mobile_gestures_commands(self, element: WebElement,
                                                                       duration: int = 1000) -> None:
         """
@@ -324,42 +278,14 @@ class BaseMobilePage(BasePage):
         :raises WebDriverException: If WebDriver encounters an error during the execution of the long press gesture
                                     using the W3C Mobile Gestures Commands.
         """
-        try:
-            self.logger.info('Retrieving the current location of the element')
-            element_location = element.location
-            self.logger.info(f'Element located at: {element_location}')
-            self.logger.info('Performing long press gesture using the W3C Mobile Gestures Commands.')
-            self.driver.execute_script(
-                'mobile: longClickGesture',
-                {'x': element_location['x'],
-                 'y': element_location['y'], 'duration': duration})
-            self.logger.info('The long press gesture was successfully performed using the W3C Mobile Gestures '
-                             'Commands.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform a long press gesture using the W3C Mobile Gestures '
-                              f'Commands. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform a long press gesture using the '
-                              f'W3C Mobile Gestures Commands. Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state for performing a long press gesture using '
-                              f'the W3C Mobile Gestures Commands. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Element is outside the viewport to perform a long press gesture using the '
-                              f'W3C Mobile Gestures Commands. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing a long press gesture using the W3C Mobile Gestures Commands.'
-                              f' Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing a long press gesture using '
-                              f'the W3C Mobile Gestures Commands. Error: {e}')
-            raise
+        gesture = self._gesture_commands['longPress']
+        # touchAndHold on iOS takes the duration in seconds, longClickGesture on Android in milliseconds.
+        if gesture == 'mobile: touchAndHold':
+            duration = duration / 1000
+        self._execute_script(gesture, {'elementId': element.id, 'duration': duration})
+        self.logger.debug('The long press gesture was successfully performed using the W3C Mobile Gestures Commands.')
 
+    @log_errors('Failed to perform a scroll gesture using the W3C Actions API')
     def perform_scroll_gesture_using_w3c_actions_api(self, start_element: WebElement, end_element: WebElement,
                                                      scroll_direction: str = 'up') -> None:
         """
@@ -383,44 +309,22 @@ class BaseMobilePage(BasePage):
         :raises WebDriverException: If WebDriver encounters an error while performing the scroll gesture using the
                                     W3C Actions API.
         """
-        try:
-            if scroll_direction.lower() == 'down' or scroll_direction.lower() == 'right':
-                self.logger.info(f'Performing scroll {scroll_direction} gesture using the W3C Actions API.')
-                self.driver.scroll(origin_el=end_element, destination_el=start_element)
-                self.logger.info(f'The scroll {scroll_direction} was successfully performed using the W3C Actions API.')
-            elif scroll_direction.lower() == 'up' or scroll_direction.lower() == 'left':
-                self.logger.info(f'Performing scroll {scroll_direction} gesture using the W3C Actions API.')
-                self.driver.scroll(origin_el=start_element, destination_el=end_element)
-                self.logger.info(f'The scroll {scroll_direction} was successfully performed using the W3C Actions API.')
-            else:
-                self.logger.error(f'Unsupported scroll type provided: {scroll_direction}. Must be "up", "down", "left",'
-                                  f'or "right".')
-                raise ValueError(f'Scroll type {scroll_direction} is not supported.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform scroll {scroll_direction} gesture using '
-                              f'the W3C Actions API. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform scroll {scroll_direction} gesture using '
-                              f'the W3C Actions API. Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state for performing scroll {scroll_direction} gesture using '
-                              f'the W3C Actions API. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Element is outside the viewport to perform scroll {scroll_direction} gesture using the '
-                              f'W3C Actions API. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing scroll {scroll_direction} gesture using '
-                              f'the W3C Actions API. Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing scroll {scroll_direction} gesture '
-                              f'using the W3C Actions API. Error: {e}')
-            raise
+        direction = scroll_direction.lower()
+        scroll_order = {
+            'down': (end_element, start_element),
+            'right': (end_element, start_element),
+            'up': (start_element, end_element),
+            'left': (start_element, end_element)
+        }.get(direction)
+        if scroll_order is None:
+            self.logger.error('Unsupported scroll type provided: %s. Must be "up", '
+                              '"down", "left",or "right".', scroll_direction)
+            raise ValueError(f'Scroll type {scroll_direction} is not supported.')
+        origin_element, destination_element = scroll_order
+        self.driver.scroll(origin_el=origin_element, destination_el=destination_element)
+        self.logger.debug('The scroll %s was successfully performed using the W3C Actions API.', direction)
 
+    @log_errors('Failed to perform a scroll gesture using the W3C Mobile Gestures Commands')
     def perform_scroll_gesture_using_w3c_mobile_gestures_commands(self, element_id: WebElement,
                                                                   scroll_direction: str = 'up', percent: float = 0.5,
                                                                   speed: int = 1000) -> None:
@@ -448,50 +352,23 @@ class BaseMobilePage(BasePage):
     :raises WebDriverException: If WebDriver encounters an error while performing the scroll gesture using the W3C
                                 Mobile Gestures Commands.
         """
-        try:
-            if percent <= 0:
-                raise ValueError(f'Invalid percent value: {percent}. Percent must be greater than 0.')
-            if speed < 0:
-                raise ValueError(f'Invalid speed value: {speed}. Speed must be a non-negative integer.')
-            if scroll_direction.lower() not in ['up', 'down', 'left', 'right']:
-                raise ValueError(f'Invalid scroll direction value: {scroll_direction}.')
-            self.logger.info(f'Performing scroll {scroll_direction} gesture using the W3C Mobile Gestures Commands.')
-            self.driver.execute_script(
-                'mobile: scrollGesture', {
-                    'elementId': element_id,
-                    'direction': scroll_direction,
-                    'percent': percent,
-                    'speed': speed
-                }
-            )
-            self.logger.info(f'The scroll {scroll_direction} was successfully performed using the W3C Mobile Gestures '
-                             f'Commands.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform scroll {scroll_direction} gesture using '
-                              f'the W3C Mobile Gestures Commands. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform scroll {scroll_direction} gesture using '
-                              f'the W3C Mobile Gestures Commands. Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state for performing scroll {scroll_direction} gesture using '
-                              f'the W3C Mobile Gestures Commands. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Element is outside the viewport to perform scroll {scroll_direction} gesture using the '
-                              f'W3C Mobile Gestures Commands. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing scroll {scroll_direction} gesture using '
-                              f'the W3C Mobile Gestures Commands. Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(
-                f'WebDriver encountered an error during performing scroll {scroll_direction} gesture using '
-                f'the W3C Mobile Gestures Commands. Error: {e}')
-            raise
+        if percent <= 0:
+            raise ValueError(f'Invalid percent value: {percent}. Percent must be greater than 0.')
+        if speed < 0:
+            raise ValueError(f'Invalid speed value: {speed}. Speed must be a non-negative integer.')
+        direction = scroll_direction.lower()
+        if direction not in _DIRECTIONS:
+            raise ValueError(f'Invalid scroll direction value: {scroll_direction}.')
+        self._run_mobile_gesture(
+            'mobile: scrollGesture', {
+                'elementId': element_id,
+                'direction': direction,
+                'percent': percent,
+                'speed': speed
+            }, 'scroll', direction
+        )
 
+    @log_errors('Failed to perform a swipe gesture using the W3C Actions API')
     def perform_swipe_gesture_using_w3c_actions_api(self, start_element: WebElement, end_element: WebElement,
                                                     swipe_direction: str = 'up') -> None:
         """
@@ -514,54 +391,23 @@ class BaseMobilePage(BasePage):
         :raises WebDriverException: If WebDriver encounters an error while performing the swipe gesture using the
                                     W3C Actions API.
         """
-        try:
-            self.logger.info(f'Getting the location of the start element: {start_element}')
-            start_element_location = start_element.location
-            self.logger.info(f'Start element is located at: {start_element_location}')
-            self.logger.info(f'Getting the location of the end element: {end_element}')
-            end_element_location = end_element.location
-            self.logger.info(f'End element is located at: {end_element_location}')
-            if swipe_direction == 'up' or swipe_direction == 'left':
-                self.logger.info(f'Performing swipe {swipe_direction} gesture using the W3C Actions API.')
-                self.driver.swipe(start_x=end_element_location['x'], start_y=end_element_location['y'],
-                                  end_x=start_element_location['x'], end_y=start_element_location['y'])
-                self.logger.info(f'Swipe {swipe_direction} gesture was successfully performed using the W3C Actions '
-                                 f'API.')
-            elif swipe_direction == 'down' or swipe_direction == 'right':
-                self.logger.info(f'Performing swipe {swipe_direction} gesture using the W3C Actions API.')
-                self.driver.swipe(start_x=start_element_location['x'], start_y=start_element_location['y'],
-                                  end_x=end_element_location['x'], end_y=end_element_location['y'])
-                self.logger.info(f'Swipe {swipe_direction} gesture was successfully performed using the W3C Actions '
-                                 f'API.')
-            else:
-                self.logger.error(f'Invalid swipe direction value: {swipe_direction}. Options are up, or down')
-                raise ValueError('Invalid swipe direction value. Options are up, down, left, or right.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform swipe {swipe_direction} gesture using the W3C Actions '
-                              f'API. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform swipe {swipe_direction} gesture using the W3C '
-                              f'Actions API. Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state for performing swipe {swipe_direction} gesture using '
-                              f'the W3C Actions API. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Element is outside the viewport to perform swipe {swipe_direction} gesture using the '
-                              f'W3C Actions API. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing swipe {swipe_direction} gesture using the W3C Actions API. '
-                              f'Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(
-                f'WebDriver encountered an error during performing swipe {swipe_direction} gesture using the W3C '
-                f'Actions API. Error: {e}')
-            raise
+        direction = swipe_direction.lower()
+        swipe_order = {
+            'up': (end_element, start_element),
+            'left': (end_element, start_element),
+            'down': (start_element, end_element),
+            'right': (start_element, end_element)
+        }.get(direction)
+        if swipe_order is None:
+            self.logger.error(_INVALID_SWIPE_DIRECTION, swipe_direction)
+            raise ValueError(_INVALID_SWIPE_DIRECTION % swipe_direction)
+        start_location, end_location = self._get_locations(*swipe_order)
+        start_x, start_y = start_location['x'], start_location['y']
+        end_x, end_y = end_location['x'], end_location['y']
+        self._swipe(start_x=start_x, start_y=start_y, end_x=end_x, end_y=end_y)
+        self.logger.debug('Swipe %s gesture was successfully performed using the W3C Actions API.', direction)
 
+    @log_errors('Failed to perform a swipe gesture using the W3C Mobile Gestures Commands')
     def perform_swipe_up_gesture_using_w3c_mobile_gestures_commands(self, element_id: WebElement,
                                                                     swipe_direction: str = 'up', percent: float = 0.3,
                                                                     speed: int = 3000) -> None:
@@ -587,53 +433,26 @@ class BaseMobilePage(BasePage):
         :raises WebDriverException: If WebDriver encounters an error while performing the swipe gesture using the W3C
                                     Mobile Gestures Commands.
         """
-        try:
-            if swipe_direction.lower() not in ['up', 'down', 'left', 'right']:
-                self.logger.error('Invalid swipe direction value. Options are up, down, left, or right.')
-                raise ValueError('Invalid swipe direction value. Options are up, down, left, or right.')
-            if not (0 <= percent <= 1):
-                self.logger.error(f'Invalid percent value: {percent}. Must be in range 0..1.')
-                raise ValueError(f'Invalid percent value: {percent}. Must be in range 0..1.')
-            if speed < 0:
-                self.logger.error(f'Invalid speed value: {speed}. Speed must be a non-negative integer.')
-                raise ValueError(f'Invalid speed value: {speed}. Speed must be a non-negative integer.')
-            self.logger.info(f'Performing swipe {swipe_direction} gesture using the W3C Mobile Gestures Commands.')
-            self.driver.execute_script(
-                'mobile: swipeGesture', {
-                    'elementId': element_id,
-                    'direction': swipe_direction,
-                    'percent': percent,
-                    'speed': speed
-                }
-            )
-            self.logger.info(f'Successfully performed swipe {swipe_direction} gesture using the W3C Mobile Gestures '
-                             f'Commands.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform swipe {swipe_direction} gesture using the W3C Mobile '
-                              f'Gestures. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform swipe {swipe_direction} gesture using the W3C '
-                              f'Mobile Gestures. Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state for performing swipe {swipe_direction} gesture using '
-                              f'the W3C Mobile Gestures. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Element is outside the viewport to perform swipe {swipe_direction} gesture using the '
-                              f'W3C Mobile Gestures. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing swipe {swipe_direction} gesture using the W3C Mobile '
-                              f'Gestures. Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(
-                f'WebDriver encountered an error during performing swipe {swipe_direction} gesture using the W3C '
-                f'Mobile Gestures. Error: {e}')
-            raise
+        direction = swipe_direction.lower()
+        if direction not in _DIRECTIONS:
+            self.logger.error(_INVALID_SWIPE_DIRECTION, swipe_direction)
+            raise ValueError(_INVALID_SWIPE_DIRECTION % swipe_direction)
+        if not (0 <= percent <= 1):
+            self.logger.error(_INVALID_PERCENT, percent)
+            raise ValueError(_INVALID_PERCENT % percent)
+        if speed < 0:
+            self.logger.error('Invalid speed value: %s. Speed must be a non-negative integer.', speed)
+            raise ValueError(f'Invalid speed value: {speed}. Speed must be a non-negative integer.')
+        self._run_mobile_gesture(
+            'mobile: swipeGesture', {
+                'elementId': element_id,
+                'direction': direction,
+                'percent': percent,
+                'speed': speed
+            }, 'swipe', direction
+        )
 
+    @log_errors('Failed to perform a flick gesture using the W3C Actions API')
     def perform_flick_gesture_using_w3c_actions_api(self, start_element: WebElement, end_element: WebElement,
                                                     flick_direction: str) -> None:
         """
@@ -656,52 +475,21 @@ class BaseMobilePage(BasePage):
         :raises WebDriverException: If WebDriver encounters an error while performing the flick gesture using the W3C
                                     Actions API.
         """
-        try:
-            self.logger.info('Retrieving the location of the start element')
-            start_element_location = start_element.location
-            self.logger.info(f'Start element located at: {start_element_location}')
-            self.logger.info('Retrieving the location of the end element')
-            end_element_location = end_element.location
-            self.logger.info(f'End element located at: {end_element_location}')
-            if flick_direction.lower() == 'up':
-                self.logger.info('Performing flick up gesture using the W3C Actions API.')
-                self.driver.flick(start_x=end_element_location['x'], start_y=end_element_location['y'],
-                                  end_x=start_element_location['x'], end_y=start_element_location['y'])
-                self.logger.info('Flick up gesture was successfully performed using the W3C Actions API.')
-            elif flick_direction.lower() == 'down':
-                self.logger.info('Performing flick down gesture using the W3C Actions API.')
-                self.driver.flick(start_x=start_element_location['x'], start_y=start_element_location['y'],
-                                  end_x=end_element_location['x'], end_y=end_element_location['y'])
-                self.logger.info('Flick down gesture was successfully performed using the W3C API Actions API.')
-            else:
-                self.logger.error('Invalid flick direction value. Options are up, down, left, or right.')
-                raise ValueError('Invalid flick direction value. Options are up, down, left, or right.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform flick {flick_direction} gesture using the W3C API '
-                              f'Actions API. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform flick {flick_direction} gesture using the W3C '
-                              f'API Actions API. Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state for performing flick {flick_direction} gesture using '
-                              f'the W3C API Actions API. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Element is outside the viewport to perform flick {flick_direction} gesture using the '
-                              f'W3C API Actions API. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing flick {flick_direction} gesture using the W3C API Actions '
-                              f'API. Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(
-                f'WebDriver encountered an error during performing flick {flick_direction} gesture using the W3C API '
-                f'Actions API. Error: {e}')
-            raise
+        direction = flick_direction.lower()
+        flick_order = {
+            'up': (end_element, start_element),
+            'down': (start_element, end_element)
+        }.get(direction)
+        if flick_order is None:
+            self.logger.error(_INVALID_FLICK_DIRECTION, flick_direction)
+            raise ValueError(_INVALID_FLICK_DIRECTION % flick_direction)
+        start_location, end_location = self._get_locations(*flick_order)
+        start_x, start_y = start_location['x'], start_location['y']
+        end_x, end_y = end_location['x'], end_location['y']
+        self._flick(start_x=start_x, start_y=start_y, end_x=end_x, end_y=end_y)
+        self.logger.debug('Flick %s gesture was successfully performed using the W3C Actions API.', direction)
 
+    @log_errors('Failed to perform a flick gesture using the W3C Mobile Gestures Commands')
     def perform_flick_gesture_using_w3c_mobile_gestures_commands(self, element_id: WebElement, flick_direction: str,
                                                                  percent: float) -> None:
         """
@@ -711,45 +499,174 @@ class BaseMobilePage(BasePage):
         :param percent:
         :return:
         """
+        direction = flick_direction.lower()
+        if direction not in _FLICK_DIRECTIONS:
+            self.logger.error(_INVALID_FLICK_DIRECTION, flick_direction)
+            raise ValueError(_INVALID_FLICK_DIRECTION % flick_direction)
+        if not (0 <= percent <= 1):
+            self.logger.error(_INVALID_PERCENT, percent)
+            raise ValueError(_INVALID_PERCENT % percent)
+        self._run_mobile_gesture(
+            'mobile: flingGesture', {
+                'elementId': element_id,
+                'direction': direction,
+                'percent': percent
+            }, 'flick', direction
+        )
+
+    @log_errors('Failed to perform the sequence of actions using the W3C Actions API')
+    def perform_action_sequence(self, actions: list[tuple]) -> None:
+        """
+        Perform a sequence of touch actions as a single W3C Actions API request.
+
+        :param actions: List of actions to perform in order. Supported actions are ('tap', element),
+                        ('long_press', element) and ('pause', seconds),
+                        e.g., [('tap', first_element), ('pause', 0.1), ('tap', second_element)].
+        :return: None.
+        :raises ValueError: If an unsupported action is provided.
+        :raises NoSuchElementException: If an element isn't found to perform the sequence of actions using the W3C
+                                        Actions API.
+        :raises ElementNotInteractableException: If an element isn't interactable to perform the sequence of actions
+                                                 using the W3C Actions API.
+        :raises StaleElementReferenceException: If an element is no longer attached to the DOM to perform the sequence
+                                                of actions using the W3C Actions API.
+        :raises MoveTargetOutOfBoundsException: If an element is outside the viewport to perform the sequence of
+                                                actions using the W3C Actions API.
+        :raises WebDriverException: If WebDriver encounters an error while performing the sequence of actions using the
+                                    W3C Actions API.
+        """
+        action_builder = ActionBuilder(self.driver, mouse=PointerInput(interaction.POINTER_TOUCH, 'touch'))
+        pointer_action = action_builder.pointer_action
+        for action, target in actions:
+            if action == 'tap':
+                pointer_action.move_to(target).pointer_down().pointer_up()
+            elif action == 'long_press':
+                pointer_action.move_to(target).pointer_down().pause(1).pointer_up()
+            elif action == 'pause':
+                pointer_action.pause(target)
+            else:
+                self.logger.error('Unsupported action: %s. Supported values are "tap", "long_press" and '
+                                  '"pause".', action)
+                raise ValueError(f'Action {action} is not supported.')
+        action_builder.perform()
+        self.logger.debug('The sequence of actions was successfully performed using the W3C Actions API.')
+
+    @log_errors('Failed to perform the batch of gestures using the Execute Driver Script command')
+    def perform_gesture_batch(self, steps: list[dict]) -> list:
+        """
+        Perform a list of Mobile Gestures Commands with a single request using the Execute Driver Script command.
+
+        The Appium server must have the execute-driver plugin installed and activated.
+
+        The gesture types are mapped to the Mobile Gestures Commands of the platform of the driver, e.g., 'tap' is
+        mobile: clickGesture on Android and mobile: tap on iOS. The args are passed to that command as they are, so
+        they must have its shape, e.g., mobile: tap on iOS requires 'x' and 'y'. Use perform_multi_tap to tap an
+        element without building the args.
+
+        :param steps: List of gestures to perform in order. Each gesture is a dict with a 'type' ('tap', 'doubleTap',
+                      'longPress' or 'drag') and the 'args' of its Mobile Gestures Command,
+                      e.g., [{'type': 'doubleTap', 'args': {'elementId': element.id}}].
+        :return: List containing the result of each gesture, in the same order as the steps.
+        :raises ValueError: If an unsupported gesture type is provided.
+        :raises WebDriverException: If WebDriver encounters an error while performing the gestures using the Execute
+                                    Driver Script command.
+        """
+        commands = []
+        for step in steps:
+            if step['type'] not in self._gesture_commands:
+                self.logger.error('Unsupported gesture type: %s. Supported values are %s.', step['type'],
+                                  list(self._gesture_commands))
+                raise ValueError(f'Gesture type {step["type"]} is not supported.')
+            commands.append({'command': self._gesture_commands[step['type']], 'args': step.get('args', {})})
+        result = self.driver.execute_driver(_GESTURE_BATCH_SCRIPT % json.dumps(commands))
+        self.logger.debug('The batch of gestures was successfully performed using the Execute Driver Script command.')
+        return result.result
+
+    def perform_multi_tap(self, element: WebElement, count: int) -> None:
+        """
+        Perform several tap gestures on an element with a single request using the Execute Driver Script command.
+
+        The Appium server must have the execute-driver plugin installed and activated (see perform_gesture_batch). The
+        arguments of the tap command are built for the platform of the driver, e.g., with the center of the element on
+        iOS.
+
+        :param element: The WebElement to tap.
+        :param count: The number of taps to perform.
+        :return: None.
+        :raises ValueError: If the count isn't a positive integer.
+        :raises WebDriverException: If WebDriver encounters an error while performing the tap gestures.
+        """
+        if count < 1:
+            self.logger.error('Invalid tap count: %s. Must be a positive integer.', count)
+            raise ValueError(f'Invalid tap count: {count}. Must be a positive integer.')
+        self.perform_gesture_batch([{'type': 'tap', 'args': self._tap_args(element)}] * count)
+
+    def _tap_args(self, element: WebElement) -> dict:
+        """
+        Get the arguments of the tap Mobile Gestures Command of the platform for an element.
+
+        mobile: tap on iOS requires the x and y coordinates, relative to the element when its id is given, so the center
+        of the element is tapped there. mobile: clickGesture on Android taps the center of the element by itself.
+
+        :param element: The WebElement to tap.
+        :return: The arguments of the tap command.
+        :raises WebDriverException: If WebDriver encounters an error while getting the size of the element on iOS.
+        """
+        if self._gesture_commands is not _IOS_GESTURE_COMMANDS:
+            return {'elementId': element.id}
+        size = element.size
+        return {'elementId': element.id, 'x': size['width'] / 2, 'y': size['height'] / 2}
+
+    @contextmanager
+    def _touch_sequence(self):
+        """
+        Queue touch actions on the ActionBuilder of the page and perform them on exit.
+
+        The ActionBuilder is shared by the gestures of the page, so its queued actions are cleared locally whether the
+        gesture is built and performed successfully or not, and a gesture that fails part way isn't sent with the next
+        one.
+
+        :return: A context manager yielding the pointer actions of the touch pointer to queue the gesture on.
+        :raises WebDriverException: If WebDriver encounters an error while performing the queued actions.
+        """
         try:
-            if flick_direction.lower() not in ['up', 'down']:
-                self.logger.error('Invalid flick direction value. Options are up, or down.')
-                raise ValueError('Invalid flick direction value. Options are up, or down.')
-            if not (0 <= percent <= 1):
-                self.logger.error(f'Invalid percent value: {percent}. Must be in range 0..1.')
-                raise ValueError(f'Invalid percent value: {percent}. Must be in range 0..1.')
-            self.logger.info(f'Performing flick {flick_direction} gesture using the W3C Mobile Gestures Commands.')
-            self.driver.execute_script(
-                'mobile: flingGesture', {
-                    'elementId': element_id,
-                    'direction': flick_direction,
-                    'percent': percent
-                }
-            )
-            self.logger.info(f'Flick {flick_direction} gesture was successfully performed using the W3C Mobile '
-                             f'Gestures Commands.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform flick {flick_direction} gesture using the W3C Mobile '
-                              f'Gestures Commands. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform flick {flick_direction} gesture using the W3C '
-                              f'Mobile Gestures Commands. Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state for performing flick {flick_direction} gesture using '
-                              f'the W3C Mobile Gestures Commands. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Element is outside the viewport to perform flick {flick_direction} gesture using the '
-                              f'W3C Mobile Gestures Commands. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing flick {flick_direction} gesture using the W3C Mobile '
-                              f'Gestures Commands. Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(
-                f'WebDriver encountered an error during performing flick {flick_direction} gesture using the W3C '
-                f'Mobile Gestures Commands. Error: {e}')
-            raise
+            yield self._touch_actions.pointer_action
+            self._touch_actions.perform()
+        finally:
+            for device in self._touch_actions.devices:
+                device.clear_actions()
+
+    def _run_mobile_gesture(self, script: str, params: dict, gesture: str, direction: str) -> None:
+        """
+        Perform a directional gesture using the W3C Mobile Gestures Commands.
+
+        :param script: The Mobile Gestures Command to execute, e.g., 'mobile: scrollGesture'.
+        :param params: The arguments of the Mobile Gestures Command.
+        :param gesture: The name of the gesture used in the logs, e.g., 'scroll'.
+        :param direction: The direction of the gesture used in the logs.
+        :return: None.
+        :raises WebDriverException: If WebDriver encounters an error while performing the gesture.
+        """
+        self._execute_script(script, params)
+        self.logger.debug('The %s %s gesture was successfully performed using the W3C Mobile Gestures '
+                          'Commands.', gesture, direction)
+
+    def _get_locations(self, *elements: WebElement) -> list[dict]:
+        """
+        Get the locations of several elements with a single WebDriver call using JavaScript.
+
+        JavaScript can only be executed in a WebView context. The first time it fails, e.g., in a native context, the
+        locations are read one by one for the rest of the page's life instead.
+
+        :param elements: The elements to get the locations of.
+        :return: List containing the {'x': ..., 'y': ...} location of each element, in the same order as the elements.
+        :raises WebDriverException: If WebDriver encounters an error while getting the locations.
+        """
+        if self._batch_locations_supported:
+            try:
+                return self._execute_script(_ELEMENT_LOCATIONS_SCRIPT, list(elements))
+            except WebDriverException as e:
+                self.logger.info('Unable to get the element locations using a single script, getting them one by '
+                                 'one. Error: %s', e)
+                self._batch_locations_supported = False
+        return [element.location for element in elements]
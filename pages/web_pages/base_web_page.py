@@ -1,119 +1,404 @@
+from contextlib import contextmanager
 from selenium import webdriver
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.common.exceptions import (TimeoutException, WebDriverException, NoSuchElementException,
                                         ElementNotInteractableException, InvalidElementStateException,
-                                        StaleElementReferenceException, MoveTargetOutOfBoundsException)
+                                        StaleElementReferenceException, MoveTargetOutOfBoundsException,
+                                        NoSuchFrameException)
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.action_chains import ActionChains
-from pages.base_page import BasePage
+from pages.base_page import BasePage, DEFAULT_POLL_FREQUENCY
+
+_ACTION_CHAIN_ERRORS = {
+    NoSuchElementException: 'Element isn\'t found to perform',
+    ElementNotInteractableException: 'Element isn\'t interactable to perform',
+    InvalidElementStateException: 'Element is in an invalid state to perform',
+    StaleElementReferenceException: 'Element is no longer attached to the DOM to perform',
+    TimeoutException: 'Timed out while performing',
+    MoveTargetOutOfBoundsException: 'Target element is outside the viewport to perform'
+}
+
+_SET_VALUE_SCRIPT = ('arguments[0].value = arguments[1];'
+                     'arguments[0].dispatchEvent(new Event("input", {bubbles: true}));'
+                     'arguments[0].dispatchEvent(new Event("change", {bubbles: true}));')
+_READY_STATES = ('loading', 'interactive', 'complete')
+_READY_STATE_SCRIPT = 'return document.readyState;'
+_READY_SELECTOR_SCRIPT = '''
+const [selector, timeout, done] = arguments;
+if (document.querySelector(selector)) {
+    done(true);
+    return;
+}
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(false);
+}, timeout);
+const observer = new MutationObserver(() => {
+    if (document.querySelector(selector)) {
+        clearTimeout(timer);
+        observer.disconnect();
+        done(true);
+    }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true});
+'''
+_NETWORK_IDLE_TIME_SCRIPT = ('const ends = performance.getEntriesByType("resource").map(entry => entry.responseEnd);'
+                             'return performance.now() - Math.max(0, ...ends);')
+_CLICK_SCRIPT = 'arguments[0].click();'
+_PAGE_STATE_SCRIPT = 'return [window.location.href, document.title, document.readyState];'
 
 
 class BaseWebPage(BasePage):
 
-    def __init__(self, driver: webdriver.Remote, timeout: int = 10):
-        super().__init__(driver, timeout)
+    __slots__ = ('_actions', '_last_hover_id', '_cached_url', '_cached_title')
+
+    def __init__(self, driver: webdriver.Remote, timeout: int = 10, poll_frequency: float = DEFAULT_POLL_FREQUENCY):
+        super().__init__(driver, timeout, poll_frequency)
+        self._actions = ActionChains(self.driver)
+        self._last_hover_id = None
+        self._cached_url = None
+        self._cached_title = None
 
-    def open_url(self, url: str) -> None:
+    def open_url(self, url: str, ready_state: str | None = None, ready_selector: str | None = None) -> None:
         """
         Open the specified URL.
 
+        With the 'eager' page load strategy of WebDriverSetup, the URL is opened once the DOM is ready, without waiting
+        for the sub-resources of the page. Wait for the elements needed, or pass ready_state to wait for the page.
+
+        Pass ready_selector to wait for the root element of a single-page application instead. A MutationObserver
+        reports it as soon as it's added to the DOM, with a single WebDriver call instead of polling. The script
+        timeout of the driver (30 seconds by default) must be longer than the timeout of the page.
+
         :param url: URL to open.
+        :param ready_state: Optional document ready state to wait for, 'interactive' or 'complete' (default is None).
+        :param ready_selector: Optional CSS selector of an element to wait for, e.g., "#app" (default is None).
         :return: None.
+        :raises ValueError: If the ready state isn't supported.
+        :raises TimeoutException: If the page doesn't reach the ready state or the element isn't added to the DOM within
+                                  the timeout.
         :raises WebDriverException: WebDriver encountered an error during opening a URL.
         """
+        if ready_state is not None and ready_state not in _READY_STATES:
+            raise ValueError(f'Unsupported ready state: {ready_state}. Supported ready states: {_READY_STATES}')
         try:
-            self.logger.info(f'Opening URL: {url}')
+            self.logger.debug('Opening URL: %s', url)
             self.driver.get(url)
-            self.logger.info(f'Page opened: {url}')
+            self.clear_element_cache()
+            self._forget_page_state()
+            if ready_state is not None:
+                self._wait_for_ready_state(ready_state)
+            if ready_selector is not None:
+                self._wait_for_selector(ready_selector)
+            self.logger.info('Page opened: %s', url)
+        except TimeoutException as e:
+            self.logger.error('Page isn\'t ready within %s sec! URL: %s, Error: %s', self.timeout, url, e)
+            raise
         except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during opening this URL:{url}. Error: {e}')
+            self.logger.error('WebDriver encountered an error during opening this URL:%s. Error: %s', url, e)
             raise
 
-    def send_keys(self, locator: tuple, keys: str) -> None:
+    def wait_for_network_idle(self, idle_time: float = 0.5) -> None:
         """
-        Send keystrokes to a web element with visible condition.
+        Wait until the current page hasn't finished loading any resource for the specified time, e.g., after opening
+        a single-page application whose content is fetched once the DOM is ready.
+
+        The resources are tracked with the Resource Timing API, so requests still in flight aren't seen and resources
+        beyond the resource timing buffer of the browser (250 by default) are ignored. Prefer waiting for the element
+        needed when there is one.
+
+        :param idle_time: Time in seconds without any resource finishing loading (default is 0.5 seconds).
+        :return: None.
+        :raises TimeoutException: If the network doesn't become idle within the timeout.
+        :raises WebDriverException: WebDriver encountered an error during waiting for the network to be idle.
+        """
+        try:
+            with self._no_implicit_wait():
+                self._wait.until(lambda driver: driver.execute_script(_NETWORK_IDLE_TIME_SCRIPT) >= idle_time * 1000)
+            self.logger.info('Network is idle for %s sec.', idle_time)
+        except TimeoutException as e:
+            self.logger.error('Network isn\'t idle within %s sec! Error: %s', self.timeout, e)
+            raise
+        except WebDriverException as e:
+            self.logger.error('WebDriver encountered an error during waiting for the network to be idle. Error: %s', e)
+            raise
+
+    def send_keys(self, locator: tuple, keys: str, visible: bool = True) -> None:
+        """
+        Send keystrokes to a web element with visible condition, or with presence condition when visible is False.
+
+        The element is looked up through the element cache of the page without checking it first (see find_element),
+        so sending keys repeatedly to the same locator costs a single request. A cached element that went stale or
+        can't be interacted with anymore is located again once.
 
         :param locator: Tuple containing (By.<method>, locator string), e.g., (By.ID, "element_id").
         :param keys: The string of keys to send.
+        :param visible: Whether to wait for the element to be visible instead of present (default is True).
         :return: None.
         :raises TimeoutException: If the element isn't visible within the timeout.
         :raises WebDriverException: WebDriver encountered an error during sending keystrokes to a web element.
         """
+        cached = visible and (locator, 'visible') in self._element_cache
+        element = self.find_element(locator, visible, check_cached=False)
+        self._forget_page_state()
+        if cached:
+            try:
+                element.send_keys(keys)
+                self.logger.info('Keys %s are sent to this element %s.', keys, locator)
+                return
+            except (StaleElementReferenceException, ElementNotInteractableException):
+                self.logger.info('Cached element is no longer usable, finding it again. Locator: %s', locator)
+                self.evict_element(locator)
+            except WebDriverException as e:
+                self.logger.error('WebDriver encountered an error during sending keys to an element. Error: %s', e)
+                raise
+            element = self.find_element(locator)
         try:
-            self.logger.info(f'Sending this keys {keys} for this element {locator} with waiting {self.timeout} '
-                             f'sec to be visible.')
-            element = WebDriverWait(self.driver, self.timeout).until(
-                ec.visibility_of_element_located(locator)
-            )
             element.send_keys(keys)
-        except TimeoutException as e:
-            self.logger.error(f'Element isn\'t found or not visible! Locator: {locator}, Error: {e}')
+            self.logger.info('Keys %s are sent to this element %s.', keys, locator)
+        except WebDriverException as e:
+            self.logger.error('WebDriver encountered an error during sending keys to an element. Error: %s', e)
+            raise
+
+    def set_value(self, locator: tuple, text: str, visible: bool = False) -> None:
+        """
+        Set the value of a web element using JavaScript, then fire its input and change events.
+
+        The value is set with a single WebDriver call whatever the length of the text, which is much faster than
+        send_keys for long strings. No key events are fired, so use send_keys when the page reacts to keystrokes, e.g.,
+        keydown or keypress handlers. JavaScript doesn't need the element to be visible, so by default the element is
+        only waited for to be present.
+
+        :param locator: Tuple containing (By.<method>, locator string), e.g., (By.ID, "element_id").
+        :param text: The value to set.
+        :param visible: Whether to wait for the element to be visible instead of present (default is False).
+        :return: None.
+        :raises TimeoutException: If the element isn't found within the timeout.
+        :raises WebDriverException: WebDriver encountered an error during setting the value of a web element.
+        """
+        element = self.find_element(locator, visible)
+        self._forget_page_state()
+        try:
+            self.driver.execute_script(_SET_VALUE_SCRIPT, element, text)
+            self.logger.info('Value of this element %s is set to %s.', locator, text)
+        except WebDriverException as e:
+            self.logger.error('WebDriver encountered an error during setting the value of an element. Error: %s', e)
             raise
+
+    def click_js(self, target: tuple | WebElement) -> None:
+        """
+        Click a web element with presence condition using JavaScript.
+
+        The element only has to be present, so there is no polling of its visibility and enabled state, and the click
+        is a single WebDriver call. A JavaScript click doesn't fire the mouse events preceding a real click, so when it
+        fails the element is clicked natively instead.
+
+        :param target: The WebElement to click, or a tuple containing (By.<method>, locator string) to find it,
+                       e.g., (By.ID, "element_id").
+        :return: None.
+        :raises TimeoutException: If the element isn't present within the timeout.
+        :raises WebDriverException: WebDriver encountered an error during clicking a web element.
+        """
+        element = self.find_present_element(target) if isinstance(target, tuple) else target
+        self._forget_page_state()
+        try:
+            try:
+                self.driver.execute_script(_CLICK_SCRIPT, element)
+            except WebDriverException as e:
+                self.logger.info('Unable to click the element using JavaScript, clicking it natively. Error: %s', e)
+                element.click()
+            self.logger.info('Element is clicked: %s.', target)
         except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during sending keys to an element. Error: {e}')
+            self.logger.error('WebDriver encountered an error during clicking an element. Error: %s', e)
             raise
 
-    def get_current_url(self) -> str:
+    def get_current_url(self, use_cache: bool = False) -> str:
         """
         Gets the current URL of the browser.
 
+        The URL read is cached until the page opens a URL, switches to a frame, sends keys, sets a value, clicks, or
+        performs an action chain. The page can't see every navigation, e.g., a redirect or a native click on a link, so
+        pass use_cache=True only when the page is known not to have changed since the URL was last read.
+
+        :param use_cache: Whether to return the cached URL if there is one (default is False).
         :return: The current URL as a string.
         :raises WebDriverException: WebDriver encountered an error during getting the current URL.
         """
+        if use_cache and self._cached_url is not None:
+            return self._cached_url
         try:
-            self.logger.info('Getting current URL.')
             url = self.driver.current_url
-            self.logger.info(f'Current URL: {url}')
+            self._cached_url = url
+            self.logger.info('Current URL: %s', url)
             return url
         except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during getting the current URL. Error: {e}')
+            self.logger.error('WebDriver encountered an error during getting the current URL. Error: %s', e)
             raise
 
-    def get_title(self) -> str:
+    def get_title(self, use_cache: bool = False) -> str:
         """
         Get the title of the current page.
 
+        The title is cached the same way as the URL in get_current_url, and single-page applications may change it at
+        any time, so pass use_cache=True only when the page is known not to have changed.
+
+        :param use_cache: Whether to return the cached title if there is one (default is False).
         :return: The page title as a string.
         :raises WebDriverException: WebDriver encountered an error during getting the title of the current page.
         """
+        if use_cache and self._cached_title is not None:
+            return self._cached_title
         try:
-            self.logger.info('Getting title.')
             title = self.driver.title
-            self.logger.info(f'Title: {title}')
+            self._cached_title = title
+            self.logger.info('Title: %s', title)
             return title
         except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during getting the title of the current page. '
-                              f'Error: {e}')
+            self.logger.error('WebDriver encountered an error during getting the title of the current '
+                              'page. Error: %s', e)
             raise
 
+    def get_page_state(self) -> dict:
+        """
+        Get the URL, title, and ready state of the current page with a single WebDriver call using JavaScript.
+
+        Prefer it over calling get_current_url and get_title one after another. While switched to a frame, the URL and
+        title are those of the frame.
+
+        :return: Dict with the 'url', 'title', and 'ready_state' of the current page.
+        :raises WebDriverException: WebDriver encountered an error during getting the state of the current page.
+        """
+        try:
+            url, title, ready_state = self.driver.execute_script(_PAGE_STATE_SCRIPT)
+            self.logger.info('Page state: URL: %s, Title: %s, Ready state: %s', url, title, ready_state)
+            return {'url': url, 'title': title, 'ready_state': ready_state}
+        except WebDriverException as e:
+            self.logger.error('WebDriver encountered an error during getting the state of the current '
+                              'page. Error: %s', e)
+            raise
+
+    def find_elements_js(self, locator: tuple, return_text: bool = False) -> list[WebElement] | list[str]:
+        """
+        Find all elements matching a locator with a single WebDriver call using JavaScript.
+
+        Nothing is waited for, so call it once the page is loaded. With return_text=True, the text of the elements is
+        returned by the same call instead of the elements, which saves one request per element when only the text is
+        needed.
+
+        :param locator: Tuple containing (By.<method>, locator string), e.g., (By.CSS_SELECTOR, "tr"). Supported
+                        strategies are the ones of find_all.
+        :param return_text: Whether to return the inner text of the elements instead of the elements (default is False).
+        :return: List of web elements found, or list of their texts when return_text is True.
+        :raises ValueError: If the locator strategy isn't supported.
+        :raises WebDriverException: WebDriver encountered an error during finding elements using JavaScript.
+        """
+        return self._find_all([locator], True, return_text, None)[0]
+
+    def get_texts(self, locator: tuple) -> list[str]:
+        """
+        Get the texts of all elements matching a locator with a single WebDriver call using JavaScript.
+
+        Use it instead of reading the text of the elements of find_elements one by one, which costs one request per
+        element.
+
+        :param locator: Tuple containing (By.<method>, locator string), e.g., (By.CSS_SELECTOR, "tr"). Supported
+                        strategies are the ones of find_elements_js.
+        :return: List of the inner texts of the elements found.
+        :raises ValueError: If the locator strategy isn't supported.
+        :raises WebDriverException: WebDriver encountered an error during finding elements using JavaScript.
+        """
+        return self._find_all([locator], True, True, None)[0]
+
+    def get_attributes(self, locator: tuple, attribute: str) -> list[str | None]:
+        """
+        Get an attribute of all elements matching a locator with a single WebDriver call using JavaScript.
+
+        :param locator: Tuple containing (By.<method>, locator string), e.g., (By.CSS_SELECTOR, "a"). Supported
+                        strategies are the ones of find_elements_js.
+        :param attribute: Name of the HTML attribute to get, e.g., "href".
+        :return: List of the attribute values of the elements found, None for the elements without the attribute.
+        :raises ValueError: If the locator strategy isn't supported.
+        :raises WebDriverException: WebDriver encountered an error during finding elements using JavaScript.
+        """
+        return self._find_all([locator], True, False, attribute)[0]
+
     def switch_to_frame(self, frame_reference) -> None:
         """
         Switch to a specific iframe on the page.
 
-        :param frame_reference: The frame element, index, or name to switch to.
+        The frame is switched to right away when it's already available, otherwise it's waited for.
+
+        :param frame_reference: The frame element, index, name, or locator tuple to switch to.
         :return: None.
         :raises TimeoutException: If the frame is not available within the timeout.
         :raises WebDriverException: WebDriver encountered an error during switching to a frame.
         """
         try:
-            self.logger.info(f'Waiting {self.timeout} sec to be available to switch to frame: {frame_reference}.')
-            WebDriverWait(self.driver, self.timeout).until(
-                ec.frame_to_be_available_and_switch_to_it(frame_reference)
-            )
+            with self._no_implicit_wait():
+                try:
+                    if isinstance(frame_reference, tuple):
+                        self.driver.switch_to.frame(self.driver.find_element(*frame_reference))
+                    else:
+                        self.driver.switch_to.frame(frame_reference)
+                except (NoSuchFrameException, NoSuchElementException):
+                    self.logger.debug('Waiting %s sec to be available to switch to frame: %s.', self.timeout,
+                                      frame_reference)
+                    self._wait.until(ec.frame_to_be_available_and_switch_to_it(frame_reference))
+            self.clear_element_cache()
+            self._forget_page_state()
+            self.logger.info('Switched to frame: %s.', frame_reference)
         except TimeoutException as e:
-            self.logger.error(f'Frame isn\'t available! Error: {e}')
+            self.logger.error('Frame isn\'t available! Error: %s', e)
             raise
         except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during switching to a frame. Error: {e}')
+            self.logger.error('WebDriver encountered an error during switching to a frame. Error: %s', e)
             raise
 
-    def perform_click_and_hold_action_chain(self, source_element: WebElement, target_element: WebElement) -> None:
+    def chain(self) -> ActionChains:
+        """
+        Start a chain of actions that is sent to the browser with a single request when perform() is called.
+
+        Use it to combine several actions instead of calling the perform_*_action_chain methods one after another,
+        e.g., self.chain().click_and_hold(source).move_to_element(target).release().double_click(element).perform().
+
+        The page reuses one ActionChains instance, so the chain is emptied on every call. Actions queued on a previous
+        chain that wasn't performed are dropped.
+
+        :return: The ActionChains instance of the page with no queued actions.
+        """
+        self._forget_page_state()
+        for device in self._actions.w3c_actions.devices:
+            device.clear_actions()
+        return self._actions
+
+    @contextmanager
+    def action_chain_sequence(self):
+        """
+        Queue the actions of several perform_*_action_chain calls and send them to the browser with a single request.
+
+        Pass the yielded ActionChains as the actions argument of the perform_*_action_chain methods, e.g.,
+        with page.action_chain_sequence() as actions:
+            page.perform_hover_over_an_element_action_chain(menu, actions=actions)
+            page.perform_context_click_action_chain(item, actions=actions)
+        The queued actions are performed on exit, unless an exception is raised inside the context.
+
+        :return: A context manager yielding the ActionChains instance to queue the actions on.
+        :raises WebDriverException: WebDriver encountered an error during performing the sequence of action chains.
+        """
+        actions = ActionChains(self.driver)
+        yield actions
+        self._forget_page_state()
+        self._perform_action_chain('sequence', actions, None)
+
+    def perform_click_and_hold_action_chain(self, source_element: WebElement, target_element: WebElement,
+                                            actions: ActionChains | None = None) -> None:
         """
          Perform a click and hold action chain on the source element, move it to the target element, and release it.
 
         :param source_element: The WebElement to click and hold.
         :param target_element: The WebElement to move to and release.
+        :param actions: Optional ActionChains to queue the actions on instead of performing them, e.g., the one of
+                        action_chain_sequence() (default is None).
         :return: None.
         :raises NoSuchElementException: If the source or target element cannot be found.
         :raises ElementNotInteractableException: If the source or target element is not visible.
@@ -123,67 +408,40 @@ class BaseWebPage(BasePage):
         :raises MoveTargetOutOfBoundsException: If the target element is outside the viewport.
         :raises WebDriverException: WebDriver encountered an error during performing click and hold action chain.
         """
-        try:
-            self.logger.info('Attempting to perform click and hold action chain.')
-            actions = ActionChains(self.driver)
-            actions.click_and_hold(source_element).move_to_element(target_element).release().perform()
-            self.logger.info('Click and hold action chain is completed successfully.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found to perform click and hold action chain. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform click and hold action chain. Error: {e}')
-            raise
-        except InvalidElementStateException as e:
-            self.logger.error(f'Element is in an invalid state. Error: {e}')
-            raise
-        except StaleElementReferenceException as e:
-            self.logger.error(f'Element is no longer attached to the DOM. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Action is timed out while performing click and hold action chain. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Target element is outside the viewport. Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing click and hold action chain. '
-                              f'Error: {e}')
-            raise
+        if actions is not None:
+            actions.click_and_hold(source_element).move_to_element(target_element).release()
+            return
+        self._perform_action_chain(
+            'click and hold', self.chain().click_and_hold(source_element).move_to_element(target_element).release(),
+            target_element
+        )
 
-    def perform_double_click_action_chain(self, element: WebElement) -> None:
+    def perform_double_click_action_chain(self, element: WebElement, actions: ActionChains | None = None) -> None:
         """
         Perform double-click action chain on the specified web element.
 
         :param element: The WebElement to double-click.
+        :param actions: Optional ActionChains to queue the actions on instead of performing them, e.g., the one of
+                        action_chain_sequence() (default is None).
         :return: None.
         :raises NoSuchElementException: If the element is not found in the DOM.
         :raises ElementNotInteractableException: If the element isn't interactable to perform double-click action chain.
         :raises TimeoutException: Timed out while performing double-click action chain.
         :raises WebDriverException: WebDriver encountered an error during performing double-click action chain.
         """
-        try:
-            self.logger.info('Attempting to perform double-click action.')
-            actions = ActionChains(self.driver)
-            actions.double_click(element).perform()
-            self.logger.info('Double-click action chain is performed successfully.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found in the DOM to perform double-click action chain. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform double-click action chain. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing double-click action chain. Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing double-click action chain. Error: {e}')
+        if actions is not None:
+            actions.double_click(element)
+            return
+        self._perform_action_chain('double-click', self.chain().double_click(element), element)
 
-    def perform_drag_and_drop_action_chain(self, source_element: WebElement, target_element: WebElement) -> None:
+    def perform_drag_and_drop_action_chain(self, source_element: WebElement, target_element: WebElement,
+                                           actions: ActionChains | None = None) -> None:
         """
          Perform a drag-and-drop action chain.
         :param source_element: The WebElement to drag.
         :param target_element: The WebElement to drop the dragged element into.
+        :param actions: Optional ActionChains to queue the actions on instead of performing them, e.g., the one of
+                        action_chain_sequence() (default is None).
         :return: None.
         :raises NoSuchElementException: If the source or target element isn't found perform drag and drop action chain.
         :raises ElementNotInteractableException: If the source or target element isn't interactable.
@@ -191,33 +449,27 @@ class BaseWebPage(BasePage):
         :raises TimeoutException: Timed out while performing drag and drop action chain.
         :raises WebDriverException: WebDriver encountered an error during performing drag and drop action chain.
         """
-        try:
-            self.logger.info('Attempting to perform drag and drop action chain.')
-            actions = ActionChains(self.driver)
-            actions.drag_and_drop(source_element, target_element).perform()
-            self.logger.info('Drag and drop action chain is performed successfully.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Source or Target element isn\'t found to perform drag and drop action chain. '
-                              f'Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform drag and drop action chain. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Target element is out of bounds for drag and drop action chain. Error: {e}')
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing drag and drop action chain. Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing drag and drop action chain. '
-                              f'Error: {e}')
-            raise
+        if actions is not None:
+            actions.drag_and_drop(source_element, target_element)
+            return
+        self._perform_action_chain('drag and drop', self.chain().drag_and_drop(source_element, target_element),
+                                   target_element)
 
-    def perform_hover_over_an_element_action_chain(self, element: WebElement) -> None:
+    def perform_hover_over_an_element_action_chain(self, element: WebElement, actions: ActionChains | None = None,
+                                                   skip_if_hovered: bool = False) -> None:
         """
         Perform a hover (mouse over) action chain over the specified element.
 
+        With skip_if_hovered=True, nothing is sent to the browser when the last action chain of the page left the mouse
+        over the element and the page hasn't opened a URL, switched to a frame, sent keys, set a value, or clicked an
+        element using JavaScript since. The page can't see the pointer moved by other calls, e.g., element.click(), so
+        only skip the hover when nothing else has touched the pointer.
+
         :param element: The WebElement to hover over.
+        :param actions: Optional ActionChains to queue the actions on instead of performing them, e.g., the one of
+                        action_chain_sequence() (default is None).
+        :param skip_if_hovered: Whether to skip the hover when the page left the mouse over the element
+                                (default is False).
         :return: None.
         :raises NoSuchElementException: If the element is not found in the DOM to perform hover over action chain.
         :raises ElementNotInteractableException: If the element isn't interactable to perform hover over action chain.
@@ -225,32 +477,21 @@ class BaseWebPage(BasePage):
         :raises TimeoutException: If the element takes too long to become interactable.
         :raises WebDriverException: WebDriver encountered an error during performing hover over an element action chain.
         """
-        try:
-            self.logger.info('Attempting to perform hover (mouse over) action chain.')
-            actions = ActionChains(self.driver)
-            actions.move_to_element(element).perform()
-            self.logger.info('Hover (mouse over) action chain is performed successfully.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found in the DOM to perform hover over action chain. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element isn\'t interactable to perform hover over action chain. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Element is out of bounds for hover over action chain. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing hover over action chain. Error: {e}')
-            raise
-        except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing hover action chain. Error: {e}')
-            raise
+        if actions is not None:
+            actions.move_to_element(element)
+            return
+        if skip_if_hovered and element.id == self._last_hover_id:
+            self.logger.info('The mouse is already over the element, skipping hover (mouse over) action chain.')
+            return
+        self._perform_action_chain('hover (mouse over)', self.chain().move_to_element(element), element)
 
-    def perform_context_click_action_chain(self, element: WebElement) -> None:
+    def perform_context_click_action_chain(self, element: WebElement, actions: ActionChains | None = None) -> None:
         """
         Perform a right-click (context-click) action chain on the specified element.
 
         :param element: The WebElement to perform the context-click on.
+        :param actions: Optional ActionChains to queue the actions on instead of performing them, e.g., the one of
+                        action_chain_sequence() (default is None).
         :return: None.
         :raises NoSuchElementException: If the element is not found in the DOM to perform context-click action chain.
         :raises ElementNotInteractableException: If the element isn't interactable to perform context-click action chain.
@@ -258,25 +499,63 @@ class BaseWebPage(BasePage):
         :raises TimeoutException: If the element takes too long to become interactable.
         :raises WebDriverException: WebDriver encountered an error during performing context click action chain.
 
+        """
+        if actions is not None:
+            actions.context_click(element)
+            return
+        self._perform_action_chain('context click (right click)', self.chain().context_click(element), element)
+
+    def _forget_page_state(self) -> None:
+        """
+        Forget the cached URL and title and the element the mouse is over, once an action may have changed the page or
+        moved the pointer, so the URL and title are read again from the browser and the next hover is performed.
+
+        :return: None.
+        """
+        self._cached_url = None
+        self._cached_title = None
+        self._last_hover_id = None
+
+    def _wait_for_ready_state(self, ready_state: str) -> None:
+        """
+        Wait until the document ready state of the current page reaches the specified one.
+
+        :param ready_state: Document ready state to wait for, 'loading', 'interactive' or 'complete'.
+        :return: None.
+        :raises TimeoutException: If the page doesn't reach the ready state within the timeout.
+        """
+        expected_states = _READY_STATES[_READY_STATES.index(ready_state):]
+        with self._no_implicit_wait():
+            self._wait.until(lambda driver: driver.execute_script(_READY_STATE_SCRIPT) in expected_states)
+
+    def _wait_for_selector(self, selector: str) -> None:
+        """
+        Wait until an element matching the CSS selector is in the DOM of the current page, using a MutationObserver.
+
+        :param selector: CSS selector of the element to wait for.
+        :return: None.
+        :raises TimeoutException: If no element matches the selector within the timeout.
+        """
+        if not self.driver.execute_async_script(_READY_SELECTOR_SCRIPT, selector, self.timeout * 1000):
+            raise TimeoutException(f'No element matches {selector} after {self.timeout} sec.')
+
+    def _perform_action_chain(self, action_name: str, actions: ActionChains,
+                              pointer_target: WebElement | None) -> None:
+        """
+        Perform a queued action chain, log the result, and track the element the mouse is left over.
+
+        :param action_name: The name of the action chain used in the logs, e.g., 'double-click'.
+        :param actions: The ActionChains instance with the queued actions.
+        :param pointer_target: The WebElement the mouse is over once the action chain is performed, or None if unknown.
+        :return: None.
+        :raises WebDriverException: WebDriver encountered an error during performing the action chain.
         """
         try:
-            self.logger.info('Attempting to perform context click (right click) action chain.')
-            actions = ActionChains(self.driver)
-            actions.context_click(element).perform()
-            self.logger.info('Context click (right click) action chain is performed successfully.')
-        except NoSuchElementException as e:
-            self.logger.error(f'Element isn\'t found in the DOM to perform context click action chain. Error: {e}')
-            raise
-        except ElementNotInteractableException as e:
-            self.logger.error(f'Element is interactable to perform context click action chain. Error: {e}')
-            raise
-        except MoveTargetOutOfBoundsException as e:
-            self.logger.error(f'Element is out of bounds for context click action chain. Error: {e}')
-            raise
-        except TimeoutException as e:
-            self.logger.error(f'Timed out while performing context click action chain. Error: {e}')
-            raise
+            self.logger.debug('Attempting to perform %s action chain.', action_name)
+            actions.perform()
+            self._last_hover_id = pointer_target.id if pointer_target is not None else None
+            self.logger.info('The %s action chain is performed successfully.', action_name)
         except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during performing context click action chain. '
-                              f'Error: {e}')
+            reason = _ACTION_CHAIN_ERRORS.get(type(e), 'WebDriver encountered an error during performing')
+            self.logger.error('%s %s action chain. Error: %s', reason, action_name, e)
             raise
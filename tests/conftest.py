@@ -5,10 +5,20 @@ from utils.web_driver_setup import WebDriverSetup
 from utils.mobile_driver_setup import MobileDriverSetup
 from utils.logging_config import setup_logger
 
-setup_logger()
 logger = logging.getLogger(__name__)
 
 
+def pytest_configure(config) -> None:
+    """
+    Set up the logging configuration once pytest is configured, instead of when this module is imported. It's the only
+    place the logging is configured, so the pages and driver setups only log through their module loggers.
+
+    :param config: The pytest config object.
+    :return: None.
+    """
+    setup_logger()
+
+
 def _teardown(driver_obj) -> None:
     """
     Tear down the WebDriver instance.
@@ -25,21 +35,33 @@ def _teardown(driver_obj) -> None:
         raise
 
 
+def _worker_id(config) -> str:
+    """
+    Get the id of the pytest-xdist worker running the tests.
+
+    :param config: The pytest config object.
+    :return: The worker id, e.g., 'gw0', or 'master' when the tests aren't run in parallel.
+    """
+    return getattr(config, 'workerinput', {}).get('workerid', 'master')
+
+
 @pytest.fixture(scope='session')
-def setup_teardown_webdriver() -> WebDriver:
+def setup_teardown_webdriver(request) -> WebDriver:
     """
      Fixture to manage the setup and teardown of a WebDriver instance.
 
+    Every pytest-xdist worker runs its own session, so running the tests in parallel with "pytest -n auto" gives each
+    worker its own WebDriver instance. WebDriver instances are never shared between workers.
+
     :return: A WebDriver instance.
     :raises Exception: If an error occurs during the creation of the WebDriver or its teardown.
     """
-    logger.info('Setting up WebDriver for the session.')
+    logger.info('Setting up WebDriver for the session of worker %s.', _worker_id(request.config))
     web_driver_setup_obj = WebDriverSetup()
     try:
         web_driver = web_driver_setup_obj.create_driver()
         logger.info('WebDriver successfully created and ready for testing.')
         yield web_driver
-        _teardown(web_driver_setup_obj)
     except Exception as e:
         logger.error(f'An error occurred during WebDriver setup stage. Error: {e}.')
         raise
@@ -47,6 +69,28 @@ def setup_teardown_webdriver() -> WebDriver:
         _teardown(web_driver_setup_obj)
 
 
+@pytest.fixture
+def fresh_page(setup_teardown_webdriver) -> WebDriver:
+    """
+     Fixture to reuse the session WebDriver instance with a clean state, instead of creating a WebDriver per test.
+
+    The cookies, local storage, and session storage of the current page are cleared and a blank page is opened.
+
+    :return: The session WebDriver instance with a clean state.
+    :raises Exception: If an error occurs while cleaning the state of the WebDriver.
+    """
+    try:
+        setup_teardown_webdriver.delete_all_cookies()
+        # Blank pages have no storage, so clearing it throws there.
+        setup_teardown_webdriver.execute_script('try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}')
+        setup_teardown_webdriver.get('about:blank')
+        logger.info('WebDriver state is cleaned for the test.')
+    except Exception as e:
+        logger.error('An error occurred while cleaning the WebDriver state. Error: %s.', e)
+        raise
+    yield setup_teardown_webdriver
+
+
 @pytest.fixture(scope='session')
 def setup_teardown_mobile_webdriver() -> WebDriver:
     """
@@ -0,0 +1,80 @@
+import json
+from unittest.mock import MagicMock
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from pages.mobile_pages.base_mobile_page import BaseMobilePage
+
+
+def _page(platform_name: str = 'Android') -> BaseMobilePage:
+    driver = MagicMock()
+    driver.capabilities = {'platformName': platform_name}
+    return BaseMobilePage(driver, timeout=0.05, poll_frequency=0.01)
+
+
+def _element() -> MagicMock:
+    element = MagicMock(id='e1')
+    element.size = {'width': 100, 'height': 40}
+    return element
+
+
+def _last_tapped_points(driver: MagicMock) -> list[tuple[int, int]]:
+    command, params = driver.execute.call_args.args
+    assert command == Command.W3C_ACTIONS
+    (pointer,) = params['actions']
+    return [(action['x'], action['y']) for action in pointer['actions'] if action['type'] == 'pointerMove']
+
+
+def test_invalid_points_are_rejected_before_any_tap_is_queued():
+    page = _page()
+
+    with pytest.raises(ValueError):
+        page.perform_taps_at([(1, 2), (3,)])
+    page.perform_tap_at(7, 8)
+
+    assert _last_tapped_points(page.driver) == [(7, 8)]
+
+
+def test_failed_gesture_is_not_sent_with_the_next_one():
+    page = _page()
+    page.driver.execute.side_effect = [WebDriverException('boom'), None]
+
+    with pytest.raises(WebDriverException):
+        page.perform_tap_at(1, 2)
+    page.perform_tap_at(7, 8)
+
+    assert _last_tapped_points(page.driver) == [(7, 8)]
+
+
+def test_single_tap_sends_the_element_id_on_android():
+    page = _page('Android')
+
+    page.perform_tap_gesture_using_w3c_mobile_gestures_commands(_element())
+
+    page.driver.execute_script.assert_called_once_with('mobile: clickGesture', {'elementId': 'e1'})
+
+
+def test_single_tap_sends_the_element_center_on_ios():
+    page = _page('iOS')
+
+    page.perform_tap_gesture_using_w3c_mobile_gestures_commands(_element())
+
+    page.driver.execute_script.assert_called_once_with('mobile: tap', {'elementId': 'e1', 'x': 50, 'y': 20})
+
+
+def test_multi_tap_uses_the_tap_command_of_the_platform():
+    page = _page('iOS')
+
+    page.perform_multi_tap(_element(), 2)
+
+    script = page.driver.execute_driver.call_args.args[0]
+    commands = json.loads(script.split('const steps = ', 1)[1].split(';\n', 1)[0])
+    assert commands == [{'command': 'mobile: tap', 'args': {'elementId': 'e1', 'x': 50, 'y': 20}}] * 2
+
+
+def test_gesture_batch_rejects_unsupported_gesture_types():
+    page = _page()
+
+    with pytest.raises(ValueError):
+        page.perform_gesture_batch([{'type': 'pinch'}])
+    page.driver.execute_driver.assert_not_called()
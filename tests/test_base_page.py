@@ -0,0 +1,151 @@
+from unittest.mock import MagicMock
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from pages import base_page
+from pages.base_page import BasePage
+
+USERNAME = (By.ID, 'username')
+PASSWORD = (By.ID, 'password')
+SUBMIT = (By.CSS_SELECTOR, 'button[type="submit"]')
+
+
+def _element(element_id: str, displayed: bool = True) -> MagicMock:
+    element = MagicMock(id=element_id)
+    element.is_displayed.return_value = displayed
+    return element
+
+
+def _page(driver: MagicMock | None = None) -> BasePage:
+    return BasePage(driver if driver is not None else MagicMock(), timeout=0.05, poll_frequency=0.01)
+
+
+def test_find_element_reuses_the_cached_element_while_it_is_displayed():
+    page = _page()
+    element = _element('e1')
+    page.driver.find_elements.return_value = [element]
+
+    assert page.find_element(USERNAME) is element
+    assert page.find_element(USERNAME) is element
+    page.driver.find_elements.assert_called_once_with(*USERNAME)
+
+
+def test_find_element_finds_a_stale_cached_element_again():
+    page = _page()
+    stale_element, fresh_element = _element('e1'), _element('e2')
+    page.driver.find_elements.return_value = [stale_element]
+    page.find_element(USERNAME)
+    stale_element.is_displayed.side_effect = StaleElementReferenceException('stale')
+    page.driver.find_elements.return_value = [fresh_element]
+
+    assert page.find_element(USERNAME) is fresh_element
+    assert page._element_cache[(USERNAME, 'visible')] is fresh_element
+
+
+def test_find_element_without_checking_the_cache_sends_no_request():
+    page = _page()
+    element = _element('e1')
+    page.driver.find_elements.return_value = [element]
+    page.find_element(USERNAME)
+    element.is_displayed.reset_mock()
+    page.driver.find_elements.reset_mock()
+
+    assert page.find_element(USERNAME, check_cached=False) is element
+    element.is_displayed.assert_not_called()
+    page.driver.find_elements.assert_not_called()
+
+
+def test_element_cache_evicts_the_least_recently_used_element(monkeypatch):
+    monkeypatch.setattr(BasePage, 'element_cache_size', 2)
+    page = _page()
+    page.driver.find_elements.side_effect = lambda by, value: [_element(value)]
+    page.find_element(USERNAME)
+    page.find_element(PASSWORD)
+    page.find_element(USERNAME)
+    page.find_element(SUBMIT)
+
+    assert list(page._element_cache) == [(USERNAME, 'visible'), (SUBMIT, 'visible')]
+
+
+def test_find_element_raises_timeout_when_the_element_is_hidden():
+    page = _page()
+    page.driver.find_elements.return_value = [_element('e1', displayed=False)]
+
+    with pytest.raises(TimeoutException):
+        page.find_element(USERNAME)
+    assert not page._element_cache
+
+
+def test_find_visible_returns_none_when_the_element_is_missing():
+    page = _page()
+    page.driver.find_elements.return_value = []
+
+    assert page.find_visible(USERNAME, timeout=0.02) is None
+
+
+def test_visibility_condition_is_reused_per_locator():
+    page = _page()
+
+    assert page._visible_element(USERNAME) is page._visible_element(USERNAME)
+    assert page._visible_element(USERNAME) is not page._visible_element(PASSWORD)
+
+
+def test_implicit_wait_is_disabled_once_per_driver():
+    driver = MagicMock()
+    _page(driver)
+    _page(driver)
+
+    driver.implicitly_wait.assert_called_once_with(0)
+
+
+def test_find_all_uses_a_single_script():
+    page = _page()
+    element = _element('e1')
+    page.driver.execute_script.return_value = [element, None]
+
+    assert page.find_all([USERNAME, PASSWORD]) == [element, None]
+    page.driver.execute_script.assert_called_once_with(base_page._FIND_ALL_SCRIPT, [list(USERNAME), list(PASSWORD)],
+                                                       False, False, None)
+    page.driver.find_elements.assert_not_called()
+
+
+def test_find_all_falls_back_to_one_lookup_per_locator():
+    page = _page()
+    element = _element('e1')
+    page.driver.execute_script.side_effect = WebDriverException('no JavaScript in a native context')
+    page.driver.find_elements.side_effect = lambda by, value: [element] if value == 'username' else []
+
+    assert page.find_all([USERNAME, PASSWORD]) == [element, None]
+    assert page.find_elements_batch(['#username', '#password']) == [[], []]
+    assert page.find_all([USERNAME, PASSWORD], all_matches=True) == [[element], []]
+
+
+def test_find_all_fallback_reads_texts_and_attributes():
+    page = _page()
+    element = _element('e1')
+    element.text = 'Name'
+    element.get_dom_attribute.return_value = 'name-field'
+    page.driver.execute_script.side_effect = WebDriverException('no JavaScript in a native context')
+    page.driver.find_elements.return_value = [element]
+
+    assert page._find_all([USERNAME], True, True, None) == [['Name']]
+    assert page._find_all([USERNAME], True, False, 'class') == [['name-field']]
+    element.get_dom_attribute.assert_called_once_with('class')
+
+
+def test_find_all_rejects_unsupported_strategies():
+    page = _page()
+
+    with pytest.raises(ValueError):
+        page.find_all([USERNAME, ('accessibility id', 'login')])
+    page.driver.execute_script.assert_not_called()
+
+
+@pytest.mark.parametrize('poll_ms, expected', [(None, 0.1), ('50', 0.05), ('abc', 0.1), ('-5', 0.1), ('0', 0.1)])
+def test_poll_frequency_falls_back_to_100_ms(monkeypatch, poll_ms, expected):
+    if poll_ms is None:
+        monkeypatch.delenv('UTAF_POLL_MS', raising=False)
+    else:
+        monkeypatch.setenv('UTAF_POLL_MS', poll_ms)
+
+    assert base_page._read_poll_frequency() == expected
@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from pages.web_pages.base_web_page import BaseWebPage
+
+SEARCH = (By.ID, 'search')
+
+
+def _page() -> BaseWebPage:
+    return BaseWebPage(MagicMock(), timeout=0.05, poll_frequency=0.01)
+
+
+def _element(element_id: str) -> MagicMock:
+    element = MagicMock(spec=WebElement)
+    element.id = element_id
+    return element
+
+
+def _actions_requests(driver: MagicMock) -> list:
+    return [call for call in driver.execute.call_args_list if call.args[0] == Command.W3C_ACTIONS]
+
+
+def test_hover_is_performed_again_over_the_same_element_by_default():
+    page = _page()
+    menu = _element('menu')
+
+    page.perform_hover_over_an_element_action_chain(menu)
+    page.perform_hover_over_an_element_action_chain(menu)
+
+    assert len(_actions_requests(page.driver)) == 2
+
+
+def test_hover_over_the_same_element_is_skipped_when_asked():
+    page = _page()
+    menu = _element('menu')
+
+    page.perform_hover_over_an_element_action_chain(menu, skip_if_hovered=True)
+    page.perform_hover_over_an_element_action_chain(menu, skip_if_hovered=True)
+    assert len(_actions_requests(page.driver)) == 1
+
+    page.click_js(_element('item'))
+    page.perform_hover_over_an_element_action_chain(menu, skip_if_hovered=True)
+    assert len(_actions_requests(page.driver)) == 2
+
+
+def test_current_url_and_title_are_read_from_the_browser_by_default():
+    page = _page()
+    page.driver.current_url = 'https://example.com/login'
+    page.driver.title = 'Login'
+    page.get_current_url()
+    page.get_title()
+    page.driver.current_url = 'https://example.com/home'
+    page.driver.title = 'Home'
+
+    assert page.get_current_url() == 'https://example.com/home'
+    assert page.get_title() == 'Home'
+    assert page.get_current_url(use_cache=True) == 'https://example.com/home'
+
+
+def test_send_keys_finds_a_stale_cached_element_again():
+    page = _page()
+    stale_element, fresh_element = MagicMock(id='e1'), MagicMock(id='e2')
+    page.driver.find_elements.return_value = [stale_element]
+    page.send_keys(SEARCH, 'first')
+    stale_element.send_keys.side_effect = StaleElementReferenceException('stale')
+    page.driver.find_elements.return_value = [fresh_element]
+
+    page.send_keys(SEARCH, 'second')
+
+    fresh_element.send_keys.assert_called_once_with('second')
+    assert page._element_cache[(SEARCH, 'visible')] is fresh_element
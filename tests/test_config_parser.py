@@ -0,0 +1,41 @@
+import pytest
+from utils.config_parser import ConfigParser
+
+
+@pytest.fixture(autouse=True)
+def config_parsers(monkeypatch):
+    monkeypatch.setattr(ConfigParser, '_instances', {})
+
+
+def test_config_file_is_parsed_once_per_file(tmp_path):
+    first_file, second_file = tmp_path / 'first.json', tmp_path / 'second.json'
+    first_file.write_text('{"WEB": {"browser": "chrome"}}')
+    second_file.write_text('{"WEB": {"browser": "firefox"}}')
+
+    first_config = ConfigParser(str(first_file))
+    first_file.write_text('{"WEB": {"browser": "edge"}}')
+
+    assert ConfigParser(str(first_file)) is first_config
+    assert first_config.get_web_browser() == 'chrome'
+    assert ConfigParser(str(second_file)).get_web_browser() == 'firefox'
+
+
+def test_missing_config_file_raises_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ConfigParser(str(tmp_path / 'missing.json'))
+
+
+def test_invalid_config_file_raises_value_error(tmp_path):
+    config_file = tmp_path / 'config.json'
+    config_file.write_text('{"WEB": ')
+
+    with pytest.raises(ValueError):
+        ConfigParser(str(config_file))
+
+
+def test_missing_key_raises_key_error(tmp_path):
+    config_file = tmp_path / 'config.json'
+    config_file.write_text('{"WEB": {}}')
+
+    with pytest.raises(KeyError):
+        ConfigParser(str(config_file)).get_web_browser()
@@ -0,0 +1,98 @@
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+import pytest
+from selenium.common.exceptions import SessionNotCreatedException
+from utils import web_driver_setup
+from utils.web_driver_setup import WebDriverSetup
+
+
+@pytest.fixture
+def driver_paths_file(tmp_path, monkeypatch):
+    driver_paths_file = tmp_path / 'driver_paths.json'
+    monkeypatch.setattr(web_driver_setup, '_DRIVER_PATHS_FILE', driver_paths_file)
+    monkeypatch.setattr(WebDriverSetup, '_driver_paths', {})
+    monkeypatch.setattr(WebDriverSetup, '_installed_browsers', set())
+    return driver_paths_file
+
+
+def _setup() -> WebDriverSetup:
+    setup = WebDriverSetup(config=MagicMock())
+    setup.browser = 'chrome'
+    return setup
+
+
+def _driver_manager(driver_path: str) -> MagicMock:
+    driver_manager = MagicMock()
+    driver_manager.return_value.install.return_value = driver_path
+    return driver_manager
+
+
+def _save(driver_paths_file, entry) -> None:
+    driver_paths_file.write_text(json.dumps({'chrome': entry}))
+
+
+def test_saved_driver_is_used_without_installing(driver_paths_file, tmp_path):
+    saved_driver = tmp_path / 'chromedriver'
+    saved_driver.touch()
+    _save(driver_paths_file, {'path': str(saved_driver), 'installed_at': time.time()})
+    driver_manager = _driver_manager('/new/chromedriver')
+
+    assert _setup()._install_driver(driver_manager) == str(saved_driver)
+    driver_manager.assert_not_called()
+
+
+@pytest.mark.parametrize('entry', ['/old/chromedriver', {'path': '/missing/chromedriver', 'installed_at': 0},
+                                   {'installed_at': 0}, {'path': 'chromedriver'}])
+def test_invalid_saved_driver_is_installed_again(driver_paths_file, entry):
+    _save(driver_paths_file, entry)
+    driver_manager = _driver_manager('/new/chromedriver')
+
+    assert _setup()._install_driver(driver_manager) == '/new/chromedriver'
+    assert json.loads(driver_paths_file.read_text())['chrome']['path'] == '/new/chromedriver'
+
+
+def test_old_saved_driver_is_refreshed_in_a_non_daemon_thread(driver_paths_file, tmp_path, monkeypatch):
+    saved_driver = tmp_path / 'chromedriver'
+    saved_driver.touch()
+    _save(driver_paths_file, {'path': str(saved_driver), 'installed_at': 0})
+    thread = MagicMock()
+    monkeypatch.setattr(web_driver_setup, 'threading', SimpleNamespace(Thread=thread))
+
+    assert _setup()._install_driver(_driver_manager('/new/chromedriver')) == str(saved_driver)
+    assert not thread.call_args.kwargs.get('daemon', False)
+    thread.return_value.start.assert_called_once_with()
+
+
+def test_saved_driver_is_installed_again_when_the_session_is_not_created(driver_paths_file, tmp_path,
+                                                                         monkeypatch):
+    saved_driver = tmp_path / 'chromedriver'
+    saved_driver.touch()
+    _save(driver_paths_file, {'path': str(saved_driver), 'installed_at': time.time()})
+    driver = MagicMock()
+    driver_class = MagicMock(side_effect=[SessionNotCreatedException('browser was updated'), driver])
+    service_class = MagicMock()
+    driver_manager = _driver_manager('/new/chromedriver')
+    monkeypatch.setitem(web_driver_setup._BROWSERS, 'chrome', (driver_class, MagicMock(), service_class,
+                                                                driver_manager))
+    setup = _setup()
+
+    setup._initialize_driver()
+
+    assert setup.driver is driver
+    assert [call.args[0] for call in service_class.call_args_list] == [str(saved_driver), '/new/chromedriver']
+    assert json.loads(driver_paths_file.read_text())['chrome']['path'] == '/new/chromedriver'
+    driver.implicitly_wait.assert_called_once_with(0)
+
+
+def test_freshly_installed_driver_is_not_installed_again(driver_paths_file, monkeypatch):
+    driver_class = MagicMock(side_effect=SessionNotCreatedException('browser is missing'))
+    driver_manager = _driver_manager('/new/chromedriver')
+    monkeypatch.setitem(web_driver_setup._BROWSERS, 'chrome', (driver_class, MagicMock(), MagicMock(),
+                                                                driver_manager))
+
+    with pytest.raises(SessionNotCreatedException):
+        _setup()._initialize_driver()
+    driver_manager.return_value.install.assert_called_once_with()
+    driver_class.assert_called_once()
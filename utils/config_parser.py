@@ -1,24 +1,63 @@
 import json
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class ConfigParser:
-    """A class to parse and manage config/config.json file."""
+    """A class to parse and manage config/config.json file.
+
+    There is a single instance per configuration file, so the file is read and parsed only once per process however
+    many times ConfigParser is instantiated.
+    """
+
+    _instances = {}
+    _lock = threading.Lock()
+
+    def __new__(cls, config_file='config/config.json'):
+        """
+        Returns the ConfigParser of the specified configuration file, loading the file the first time.
+
+        Args:
+            config_file (str): Path to the JSON configuration file.
+
+        Returns:
+            ConfigParser: The ConfigParser of the configuration file.
 
-    def __init__(self, config_file='config/config.json'):
+        Raises:
+            FileNotFoundError: If the specified configuration file does not exist.
+        """
+        with cls._lock:
+            instance = cls._instances.get(config_file)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._load(config_file)
+                cls._instances[config_file] = instance
+            return instance
+
+    def _load(self, config_file):
         """
-        Initializes the ConfigParser with the specified configuration file.
+        Loads the specified configuration file, parsing it with orjson when it's installed.
 
         Args:
             config_file (str): Path to the JSON configuration file.
 
         Raises:
             FileNotFoundError: If the specified configuration file does not exist.
+            ValueError: If the specified configuration file isn't valid JSON.
         """
         try:
-            with open(config_file) as file:
-                self.config = json.load(file)
+            with open(config_file, 'rb', buffering=0) as file:
+                data = file.read()
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
+        try:
+            self.config = orjson.loads(data) if orjson is not None else json.loads(data)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in configuration file {config_file}: {e}")
 
     def get_web_urls(self):
         """Retrieve URLs from the WEB section.
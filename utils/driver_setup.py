@@ -1,17 +1,19 @@
 import logging
-from logging_config import setup_logger
-from config_parser import ConfigParser
+from utils.config_parser import ConfigParser
 from selenium.common.exceptions import WebDriverException
 
 
-setup_logger()
-
-
 class DriverSetup:
 
-    def __init__(self):
+    def __init__(self, config: ConfigParser | None = None):
+        """
+        Initializes the DriverSetup class.
+
+        :param config: ConfigParser to read the configuration from, e.g., one shared by several driver setups
+                       (default is the ConfigParser of config/config.json).
+        """
         self.driver = None
-        self.config = ConfigParser()
+        self.config = config if config is not None else ConfigParser()
         self.logger = logging.getLogger(__name__)
 
     def quit_driver(self) -> None:
@@ -27,7 +29,7 @@ class DriverSetup:
                 self.driver.quit()
                 self.logger.info('The Mobile WebDriver instance is quited successfully.')
             except WebDriverException as e:
-                self.logger.error(f'Failed to quit the WebDriver instance. Error: {e}.')
+                self.logger.error('Failed to quit the WebDriver instance. Error: %s.', e)
                 raise
             finally:
                 self.driver = None
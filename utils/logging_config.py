@@ -1,11 +1,38 @@
+import functools
 import logging
 import logging.config
+from selenium.common.exceptions import WebDriverException
 
 
 def setup_logger():
-    """Sets up logging configuration."""
+    """Sets up logging configuration.
+
+    Calling it again does nothing, since logging.basicConfig returns early once the root logger has handlers, so
+    handlers are never attached twice.
+    """
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[logging.StreamHandler()]
     )
+
+
+def log_errors(message: str, exceptions: tuple[type[Exception], ...] = (WebDriverException,)):
+    """
+    Decorate a method to log the errors raised while running it with the logger of its instance and re-raise them.
+
+    :param message: Description of the failure used in the error message, e.g., 'Failed to perform a tap gesture'.
+    :param exceptions: The exception types to log, others are re-raised without logging (default is
+                       WebDriverException).
+    :return: The decorator.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except exceptions as e:
+                self.logger.error('%s. %s: %s', message, type(e).__name__, e)
+                raise
+        return wrapper
+    return decorator
@@ -1,18 +1,39 @@
+from functools import cached_property
 from appium import webdriver
-from selenium.common.exceptions import WebDriverException
 from appium.options.android import UiAutomator2Options
-from driver_setup import DriverSetup
+from utils.driver_setup import DriverSetup
+from utils.logging_config import log_errors
 
 
 class MobileDriverSetup(DriverSetup):
     """
     A class to manage the setup and teardown of Mobile WebDriver for Appium tests.
+
+    The MOBILE section of the config.json is read only when the mobile driver is created. The elements are waited for
+    by the page objects, so the implicit wait of the driver is disabled.
     """
-    def __init__(self):
-        super().__init__()
-        self.appium_server_url = self.get_appium_server_url()
-        self.desired_capabilities = self.get_mobile_desired_capabilities()
 
+    @cached_property
+    def appium_server_url(self) -> str:
+        """
+        The appium server url from the config.json file, retrieved on first access.
+
+        :return: The appium server url.
+        :raises Exception: If there is an unexpected error occurs during getting appium server url.
+        """
+        return self.get_appium_server_url()
+
+    @cached_property
+    def desired_capabilities(self) -> dict:
+        """
+        The mobile desired capabilities from the config.json file, retrieved on first access.
+
+        :return: A dictionary containing the mobile desired capabilities.
+        :raises Exception: If there is an unexpected error occurs during getting mobile desired capabilities.
+        """
+        return self.get_mobile_desired_capabilities()
+
+    @log_errors('An error occurred while initializing the mobile driver', (Exception,))
     def create_mobile_driver(self) -> webdriver.Remote:
         """
         Create a mobile WebDriver instance based on the specified desired capabilities.
@@ -21,19 +42,14 @@ class MobileDriverSetup(DriverSetup):
         :raises WebDriverException: If there are issues initializing the mobile WebDriver.
         :raises Exception: For any unexpected errors during driver creation.
         """
-        try:
-            self.logger.info('Attempting to initialize Mobile WebDriver')
-            desired_capabilities = UiAutomator2Options().load_capabilities(self.desired_capabilities)
-            self.driver = webdriver.Remote(self.appium_server_url, options=desired_capabilities)
-            self.logger.info('Mobile driver successfully initialized')
-            return self.driver
-        except WebDriverException as e:
-            self.logger.error(f'Mobile driver encountered an error during initialization. Error: {e}.')
-            raise
-        except Exception as e:
-            self.logger.error(f'An unexpected error occurred while initializing the mobile driver. Error: {e}.')
-            raise
+        self.logger.info('Attempting to initialize Mobile WebDriver')
+        desired_capabilities = UiAutomator2Options().load_capabilities(self.desired_capabilities)
+        self.driver = webdriver.Remote(self.appium_server_url, options=desired_capabilities)
+        self.driver.implicitly_wait(0)
+        self.logger.info('Mobile driver successfully initialized')
+        return self.driver
 
+    @log_errors('An unexpected error occurred while getting mobile desired capabilities', (Exception,))
     def get_mobile_desired_capabilities(self) -> dict:
         """
         Retrieve the mobile desired capabilities from the config.json file
@@ -41,16 +57,13 @@ class MobileDriverSetup(DriverSetup):
         :return desired_capabilities: A dictionary containing the mobile desired capabilities.
         :raises Exception: If there is an unexpected error occurs during getting mobile desired capabilities.
         """
-        try:
-            self.logger.info('Attempting to retrieve mobile desired capabilities from the config.json')
-            desired_capabilities = self.config.get_mobile_desired_capabilities()
-            self.logger.info(f'Mobile desired capabilities retrieved successfully. '
-                             f'Desired capabilities: {desired_capabilities}')
-            return desired_capabilities
-        except Exception as e:
-            self.logger.error(f'An unexpected error occurred while getting mobile desired capabilities. Error: {e}')
-            raise
+        self.logger.info('Attempting to retrieve mobile desired capabilities from the config.json')
+        desired_capabilities = self.config.get_mobile_desired_capabilities()
+        self.logger.info('Mobile desired capabilities retrieved successfully. '
+                         'Desired capabilities: %s', desired_capabilities)
+        return desired_capabilities
 
+    @log_errors('Unexpected error occurred while getting Appium server url', (Exception,))
     def get_appium_server_url(self) -> str:
         """
         Retrieve the appium server url from the config.json file.
@@ -58,11 +71,7 @@ class MobileDriverSetup(DriverSetup):
         :return appium_server_url: the appium server url.
         :raises Exception: If there is an unexpected error occurs during getting appium server url.
         """
-        try:
-            self.logger.info('Attempting to retrieve Appium server url from the config.json')
-            appium_server_url = self.config.get_mobile_appium_server()
-            self.logger.info(f'Appium server url retrieved successfully. Appium server url: {appium_server_url}')
-            return appium_server_url
-        except Exception as e:
-            self.logger.error(f'Unexpected error occurred while getting Appium server url. Error: {e}')
-            raise
+        self.logger.info('Attempting to retrieve Appium server url from the config.json')
+        appium_server_url = self.config.get_mobile_appium_server()
+        self.logger.info('Appium server url retrieved successfully. Appium server url: %s', appium_server_url)
+        return appium_server_url
@@ -1,3 +1,9 @@
+import json
+import os
+import threading
+import time
+from functools import cached_property
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.remote.webdriver import WebDriver
 from webdriver_manager.chrome import ChromeDriverManager
@@ -7,18 +13,91 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
-from driver_setup import DriverSetup
+from utils.driver_setup import DriverSetup
+from utils.logging_config import log_errors
+
+_DRIVER_PATHS_FILE = Path.home() / '.cache' / 'utaf' / 'driver_paths.json'
+_DRIVER_PATHS_MAX_AGE = 24 * 60 * 60
+_driver_paths_lock = threading.Lock()
+_BROWSERS = {
+    'chrome': (webdriver.Chrome, webdriver.ChromeOptions, ChromeService, ChromeDriverManager),
+    'edge': (webdriver.Edge, webdriver.EdgeOptions, EdgeService, EdgeChromiumDriverManager),
+    'firefox': (webdriver.Firefox, webdriver.FirefoxOptions, FirefoxService, GeckoDriverManager)
+}
+
+
+def _read_driver_paths() -> dict:
+    """
+    Read the driver paths installed by the previous runs.
+
+    :return: Dict mapping the browser names to dicts with the 'path' of their driver and the 'installed_at' timestamp.
+    """
+    try:
+        driver_paths = json.loads(_DRIVER_PATHS_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return driver_paths if isinstance(driver_paths, dict) else {}
+
+
+def _read_saved_driver(browser: str) -> dict | None:
+    """
+    Read the driver saved by the previous runs for a browser, if its entry is valid and the driver still exists.
+
+    :param browser: The browser name (e.g., 'chrome', 'firefox', 'edge').
+    :return: Dict with the 'path' of the driver and the 'installed_at' timestamp, or None if there is no usable one.
+    """
+    saved = _read_driver_paths().get(browser)
+    if (not isinstance(saved, dict) or not isinstance(saved.get('path'), str)
+            or not isinstance(saved.get('installed_at'), (int, float)) or not os.path.exists(saved['path'])):
+        return None
+    return saved
+
+
+def _save_driver_path(browser: str, driver_path: str) -> None:
+    """
+    Save the installed driver path of a browser for the next runs.
+
+    :param browser: The browser name (e.g., 'chrome', 'firefox', 'edge').
+    :param driver_path: The path of the installed driver.
+    :return: None.
+    """
+    with _driver_paths_lock:
+        driver_paths = _read_driver_paths()
+        driver_paths[browser] = {'path': driver_path, 'installed_at': time.time()}
+        try:
+            _DRIVER_PATHS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            temporary_file = _DRIVER_PATHS_FILE.with_suffix(f'.{os.getpid()}.tmp')
+            temporary_file.write_text(json.dumps(driver_paths))
+            os.replace(temporary_file, _DRIVER_PATHS_FILE)
+        except OSError:
+            pass
 
 
 class WebDriverSetup(DriverSetup):
     """
     A class to manage the setup and teardown of Web WebDriver instances based on a specified browser.
+
+    Pages are loaded with the 'eager' page load strategy, so navigation returns once the DOM is ready instead of
+    waiting for images, stylesheets, and other sub-resources. The elements are waited for by the page objects, so the
+    implicit wait of the driver is disabled.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.browser = self.get_specified_browser()
+    page_load_strategy = 'eager'
+    _driver_paths = {}
+    _installed_browsers = set()
+
+    @cached_property
+    def browser(self) -> str:
+        """
+        The specified browser from the config.json, retrieved on first access, so the WEB section of the config.json
+        is read only when the web driver is created.
 
+        :return: The browser name (e.g., 'chrome', 'firefox', 'edge').
+        :raises ValueError: If the specified browser is not supported or specified.
+        """
+        return self.get_specified_browser()
+
+    @log_errors('An error occurred while trying to retrieve the specified browser', (Exception,))
     def get_specified_browser(self) -> str:
         """
         Retrieve the specified browser from the config.json.
@@ -26,17 +105,14 @@ class WebDriverSetup(DriverSetup):
         :return browser: The browser name (e.g., 'chrome', 'firefox', 'edge').
         :raises ValueError: If the specified browser is not supported or specified.
         """
-        try:
-            self.logger.info('Getting specified browser from the config.json')
-            browser = self.config.get_web_browser().lower()
-            if browser not in ['chrome', 'firefox', 'edge']:
-                self.logger.error('Specified browser is not supported.')
-                raise ValueError(f'Specified browser {browser} is not supported.')
-            return browser
-        except Exception as e:
-            self.logger.error(f'An error occurred while trying to retrieve the specified browser. Error: {e}')
-            raise
+        self.logger.info('Getting specified browser from the config.json')
+        browser = self.config.get_web_browser()
+        if browser not in _BROWSERS:
+            self.logger.error('Specified browser is not supported.')
+            raise ValueError(f'Specified browser {browser} is not supported.')
+        return browser
 
+    @log_errors('An unexpected error occurred while creating the Web WebDriver', (Exception,))
     def create_driver(self) -> WebDriver:
         """
         Create and initialize a WebDriver instance based on the specified browser.
@@ -44,40 +120,90 @@ class WebDriverSetup(DriverSetup):
         :return: A WebDriver instance for the specified browser.
         :raises Exception: For any unexpected errors during driver initialization.
         """
+        self.logger.info('Attempting to initialize Web WebDriver for browser: %s', self.browser)
+        self._initialize_driver()
+        self.logger.info('%s Web WebDriver successfully initialized', self.browser.capitalize())
+        return self.driver
+
+    def _install_driver(self, driver_manager, reinstall: bool = False) -> str:
+        """
+        Install the driver of the specified browser once per process and reuse its path for the next drivers.
+
+        The path is also saved for the next runs under ~/.cache/utaf. A saved path is used right away, so no network
+        request is made when starting a driver. When it's older than a day, the driver is installed again in a
+        background thread for the next runs. The thread isn't a daemon, so the process waits for it before exiting
+        instead of leaving a partial download behind.
+
+        :param driver_manager: The webdriver_manager class of the browser, e.g., ChromeDriverManager.
+        :param reinstall: Whether to install the driver even if a path is known, e.g., when the saved driver no longer
+                          matches the browser (default is False).
+        :return: The path of the installed driver.
+        """
+        if not reinstall:
+            driver_path = self._driver_paths.get(self.browser)
+            if driver_path is not None:
+                return driver_path
+            saved = _read_saved_driver(self.browser)
+            if saved is not None:
+                if time.time() - saved['installed_at'] > _DRIVER_PATHS_MAX_AGE:
+                    self.logger.info('Using the saved driver of %s and installing it again in the background',
+                                     self.browser)
+                    threading.Thread(target=self._refresh_driver, args=(self.browser, driver_manager)).start()
+                self._driver_paths[self.browser] = saved['path']
+                return saved['path']
+        self.logger.info('Installing the driver of %s', self.browser)
+        driver_path = driver_manager().install()
+        _save_driver_path(self.browser, driver_path)
+        self._driver_paths[self.browser] = driver_path
+        self._installed_browsers.add(self.browser)
+        return driver_path
+
+    def _refresh_driver(self, browser: str, driver_manager) -> None:
+        """
+        Install the driver of a browser again and save its path for the next runs.
+
+        :param browser: The browser name (e.g., 'chrome', 'firefox', 'edge').
+        :param driver_manager: The webdriver_manager class of the browser, e.g., ChromeDriverManager.
+        :return: None.
+        """
         try:
-            self.logger.info(f'Attempting to initialize Web WebDriver for browser: {self.browser}')
-            self._initialize_driver()
-            self.logger.info(f'{self.browser.capitalize()} Web WebDriver successfully initialized')
-            return self.driver
+            _save_driver_path(browser, driver_manager().install())
+            self.logger.info('The driver of %s is installed again for the next runs', browser)
         except Exception as e:
-            self.logger.error(f'An unexpected error occurred while creating the Web WebDriver. Error: {e}')
-            raise
+            self.logger.warning('Failed to install the driver of %s again. Error: %s', browser, e)
 
     def _initialize_driver(self) -> None:
         """
         Initialize WebDriver based on browser type.
 
+        The browser is looked up in the _BROWSERS table, which get_specified_browser has already validated it against.
+        When a driver saved by a previous run can't create a session, e.g., after a browser update, the driver is
+        installed again and the session is created once more.
+
         :return: None.
         :raises ValueError: If the specified browser is not supported.
         :raises SessionNotCreatedException: If there is an issue with creating a session.
         :raises WebDriverException: if WebDriver encountered an unexpected error during initialization.
         """
         try:
-            if self.browser == 'chrome':
-                self.logger.info('Initializing Chrome WebDriver')
-                self.driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()))
-            elif self.browser == 'edge':
-                self.logger.info('Initializing Edge WebDriver')
-                self.driver = webdriver.Edge(service=EdgeService(EdgeChromiumDriverManager().install()))
-            elif self.browser == 'firefox':
-                self.logger.info('Initializing Firefox WebDriver')
-                self.driver = webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()))
-            else:
-                self.logger.error(f'Unsupported browser: {self.browser}')
-                raise ValueError(f'Unsupported browser: {self.browser}')
+            driver_class, options_class, service_class, driver_manager = _BROWSERS[self.browser]
+            self.logger.info('Initializing %s WebDriver', self.browser.capitalize())
+            options = options_class()
+            options.page_load_strategy = self.page_load_strategy
+            service = service_class(self._install_driver(driver_manager))
+            try:
+                self.driver = driver_class(service=service, options=options)
+            except SessionNotCreatedException as e:
+                if self.browser in self._installed_browsers:
+                    raise
+                self.logger.warning('Session could not be created with the saved driver of %s, installing it '
+                                    'again. Error: %s', self.browser, e)
+                service = service_class(self._install_driver(driver_manager, reinstall=True))
+                self.driver = driver_class(service=service, options=options)
+            self.driver.implicitly_wait(0)
         except SessionNotCreatedException as e:
-            self.logger.error(f'Session could not be created. Error: {e}')
+            self.logger.error('Session could not be created. Error: %s', e)
             raise
         except WebDriverException as e:
-            self.logger.error(f'WebDriver encountered an error during the initialization process. Error: {e}')
+            self.logger.error('WebDriver encountered an error during the initialization process. Error: %s', e)
             raise